@@ -1,55 +1,62 @@
 import numpy as np
-from scipy import signal
 
-def generate_ecg_like_signal(duration, fs):
+def generate_ecg_like_signal(duration, fs, rng=None, out=None):
     """
     Generate an ECG-like signal with random variations in amplitude and width.
 
     Args:
     duration (float): Duration of the signal in seconds
     fs (int): Sampling frequency in Hz
+    rng (numpy.random.Generator): Random number generator. A new one is created if None.
+    out (numpy.ndarray): 1D array the complexes are added to. A zero signal is created if None.
 
     Returns:
     numpy.ndarray: 1D array of ECG-like signal
     """
-    t = np.linspace(0, duration, int(duration * fs), endpoint=False)
-    ecg = np.zeros_like(t)
-    
-    # Generate QRS complexes
-    for i in np.arange(0, duration, np.random.uniform(1, 3)):
-        qrs_center = int(i * fs)
-        qrs_width = int(np.random.uniform(0.08, 0.12) * fs)  # Random width between 80-120 ms
-        qrs = signal.gaussian(2 * qrs_width, std=qrs_width / 5)
-        
-        # Random amplitude variation around -300
-        amplitude = np.random.uniform(0.8, 1.2) * 300
-        
-        start = max(0, qrs_center - qrs_width)
-        end = min(len(ecg), qrs_center + qrs_width)
-        ecg[start:end] -= amplitude * qrs[:end-start]
+    rng = np.random.default_rng() if rng is None else rng
+    ecg = np.zeros(int(duration * fs), dtype=np.float32) if out is None else out
+    
+    # Generate QRS complexes, all at once: random width between 80-120 ms and
+    # random amplitude variation around -300
+    qrs_centers = (np.arange(0, duration, rng.uniform(1, 3)) * fs).astype(int)
+    qrs_widths = (rng.uniform(0.08, 0.12, len(qrs_centers)) * fs).astype(int)
+    amplitudes = rng.uniform(0.8, 1.2, len(qrs_centers)) * 300
+    
+    # Gaussian window of every complex, one per row and zero-padded to the widest
+    offsets = np.arange(2 * qrs_widths.max())
+    n = offsets - (2 * qrs_widths[:, np.newaxis] - 1) / 2
+    qrs = np.exp(-0.5 * (n / (qrs_widths[:, np.newaxis] / 5)) ** 2)
+    
+    starts = np.maximum(qrs_centers - qrs_widths, 0)
+    ends = np.minimum(qrs_centers + qrs_widths, len(ecg))
+    valid = offsets < (ends - starts)[:, np.newaxis]
+    np.add.at(ecg, (starts[:, np.newaxis] + offsets)[valid], -(amplitudes[:, np.newaxis] * qrs)[valid])
     
     return ecg
     
-def generate_impulsive_noise(num_samples, num_channels, rate=0.001, amplitude_range=(50, 200)):
+def generate_impulsive_noise(num_samples, num_channels, rate=0.001, amplitude_range=(50, 200), rng=None):
     """
     Generate impulsive noise.
     
     Args:
     num_samples (int): Number of samples in the signal
     num_channels (int): Number of channels
-    rate (float): Probability of an impulse occurring at each sample
+    rate (float or numpy.ndarray): Probability of an impulse occurring at each sample, or one per channel
     amplitude_range (tuple): Range of possible amplitudes for impulses
+    rng (numpy.random.Generator): Random number generator. A new one is created if None.
     
     Returns:
     numpy.ndarray: 2D array of impulsive noise (samples x channels)
     """
+    rng = np.random.default_rng() if rng is None else rng
     # Generate random locations for impulses
-    impulse_locations = np.random.random((num_samples, num_channels)) < rate
-    # Generate random amplitudes for impulses
-    impulse_amplitudes = np.random.uniform(amplitude_range[0], amplitude_range[1], (num_samples, num_channels))
-    return impulse_locations * impulse_amplitudes
+    impulse_locations = np.flatnonzero(rng.random((num_samples, num_channels)) < rate)
+    # Generate random amplitudes only for the impulses
+    impulsive_noise = np.zeros((num_samples, num_channels), dtype=np.float32)
+    impulsive_noise.flat[impulse_locations] = rng.uniform(amplitude_range[0], amplitude_range[1], impulse_locations.size)
+    return impulsive_noise
 
-def generate_small_oscillations(num_samples, num_channels, num_oscillations=3, duration_range=(0.1, 0.5), amplitude_range=(50, 200)):
+def generate_small_oscillations(num_samples, num_channels, num_oscillations=3, duration_range=(0.1, 0.5), amplitude_range=(50, 200), rng=None):
     """
     Generate sparse small oscillations.
     
@@ -59,17 +66,19 @@ def generate_small_oscillations(num_samples, num_channels, num_oscillations=3, d
     num_oscillations (int): Number of oscillations to generate
     duration_range (tuple): Range of possible durations for oscillations (in seconds)
     amplitude_range (tuple): Range of possible amplitudes for oscillations
+    rng (numpy.random.Generator): Random number generator. A new one is created if None.
     
     Returns:
     numpy.ndarray: 2D array of small oscillations (samples x channels)
     """
-    oscillations = np.zeros((num_samples, num_channels))
+    rng = np.random.default_rng() if rng is None else rng
+    oscillations = np.zeros((num_samples, num_channels), dtype=np.float32)
     for _ in range(num_oscillations):
-        start = np.random.randint(0, num_samples)
-        duration = np.random.uniform(*duration_range) * num_samples
+        start = rng.integers(0, num_samples)
+        duration = rng.uniform(*duration_range) * num_samples
         end = min(int(start + duration), num_samples)
-        amplitude = np.random.uniform(*amplitude_range)
-        channel = np.random.randint(0, num_channels)
+        amplitude = rng.uniform(*amplitude_range)
+        channel = rng.integers(0, num_channels)
         t = np.linspace(0, 2*np.pi, end-start)
         oscillations[start:end, channel] = amplitude * np.sin(t)
     return oscillations
@@ -84,33 +93,28 @@ def generate_artificial_data(duration=10, fs=20000, num_channels=5):
     num_channels (int): Number of channels to generate
     
     Returns:
-    numpy.ndarray: 2D array of artificial data (samples x channels)
+    numpy.ndarray: 2D single-precision array of artificial data (samples x channels)
     """
     num_samples = int(duration * fs)
+    rng = np.random.default_rng()
+    
+    # Stages that are independent per channel are generated for all channels at once
+    # Generate white noise (below 10 microvolts), 2-4 microvolts std dev per channel
+    data = rng.standard_normal((num_samples, num_channels), dtype=np.float32)
+    data *= rng.uniform(2, 4, num_channels).astype(np.float32)
     
-    data = np.zeros((num_samples, num_channels))
+    # Add impulsive noise, with a different rate per channel
+    data += generate_impulsive_noise(num_samples, num_channels, rate=rng.uniform(0.0005, 0.0015, num_channels), rng=rng)
+    
+    # Add some random drift
+    data += np.cumsum(rng.standard_normal((num_samples, num_channels), dtype=np.float32) * np.float32(0.01), axis=0)
     
     for channel in range(num_channels):
-        # Generate white noise (below 10 microvolts)
-        noise = np.random.normal(0, np.random.uniform(2, 4), num_samples)  # 2-4 microvolts std dev
-        
-        # Generate ECG-like signal with variation
-        ecg = generate_ecg_like_signal(duration, fs)
-        
-        # Generate impulsive noise
-        impulsive_noise = generate_impulsive_noise(num_samples, 1, rate=np.random.uniform(0.0005, 0.0015)).flatten()
-        
-        # Generate small oscillations
-        small_oscillations = generate_small_oscillations(num_samples, 1, num_oscillations=np.random.randint(2, 5)).flatten()
-        
-        # Combine noise, ECG-like signal, impulsive noise, and small oscillations
-        channel_data = noise + ecg + impulsive_noise + small_oscillations
-        
-        # Add some random drift
-        drift = np.cumsum(np.random.normal(0, 0.01, num_samples))
-        channel_data += drift
+        # Add ECG-like signal with variation, accumulated directly into the channel
+        generate_ecg_like_signal(duration, fs, rng, out=data[:, channel])
         
-        data[:, channel] = channel_data
+        # Add small oscillations
+        data[:, channel] += generate_small_oscillations(num_samples, 1, num_oscillations=rng.integers(2, 5), rng=rng)[:, 0]
     
     return data
 
@@ -11,10 +11,10 @@ def generate_test_data(num_samples=10000, num_channels=5, sampling_rate=1000):
     sampling_rate (int): Sampling rate in Hz
     
     Returns:
-    numpy.ndarray: 2D array of voltage data (samples x channels)
+    numpy.ndarray: 2D single-precision array of voltage data (samples x channels)
     """
     time = np.arange(num_samples) / sampling_rate
-    data = np.zeros((num_samples, num_channels))
+    data = np.zeros((num_samples, num_channels), dtype=np.float32)
     
     for i in range(num_channels):
         # Generate a sine wave with different frequency for each channel
@@ -12,7 +12,7 @@ setup(
         'scipy>=1.7.0',
         'matplotlib>=3.4.2',
         'pandas>=1.3.0',
-        'openpyxl>=3.0.7',
+        'XlsxWriter>=1.4.0',
         'intan_reader>=0.1.0',
     ],
     python_requires='>=3.8',
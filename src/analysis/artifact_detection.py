@@ -40,6 +40,10 @@ def detect_artifacts(data, threshold=5, segment_size=1000, positive_penalty=1.5)
 def detect_artifacts_all_channels(data, threshold=5, segment_size=1000, positive_penalty=1.5):
     """
     Detect artifacts in all channels of data.
+
+    Gives the same result as detect_artifacts applied to every channel, but the
+    segment averages and z-scores of all channels are computed in single
+    whole-array operations.
     
     Args:
     data (numpy.ndarray): 2D array of voltage data (samples x channels)
@@ -48,6 +52,24 @@ def detect_artifacts_all_channels(data, threshold=5, segment_size=1000, positive
     positive_penalty (float): Extra penalty for positive signals
     
     Returns:
-    numpy.ndarray: 2D boolean array where True indicates an artifact
+    numpy.ndarray: 2D boolean array where True indicates an artifact, stored channel-major
     """
-    return np.apply_along_axis(lambda x: detect_artifacts(x, threshold, segment_size, positive_penalty), 0, data)
\ No newline at end of file
+    num_samples, num_channels = data.shape
+    num_segments = num_samples // segment_size
+    segments = data[:num_segments * segment_size].reshape(num_segments, segment_size, num_channels)
+    averaged_segments = np.mean(segments, axis=1)
+    
+    # Compute the z-score of the averaged segments of each channel
+    z_scores = (averaged_segments - np.mean(averaged_segments, axis=0)) / np.std(averaged_segments, axis=0)
+    
+    # Apply extra penalty to positive signals
+    z_scores[z_scores > 0] *= positive_penalty
+    
+    # Identify artifacts
+    artifacts = np.abs(z_scores) > threshold
+    
+    # Expand artifacts to original data size; samples past the last full segment are never artifacts
+    expanded_artifacts = np.zeros((num_channels, num_samples), dtype=bool)
+    expanded_artifacts[:, :num_segments * segment_size] = np.repeat(artifacts.T, segment_size, axis=1)
+    
+    return expanded_artifacts.T
@@ -0,0 +1,37 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+NUM_WORKERS = os.cpu_count() or 1
+
+# One pool shared by all parallel computations, so that threads are started once
+# instead of on every call
+_executor = ThreadPoolExecutor(max_workers=NUM_WORKERS)
+
+def run_in_blocks(process_block, num_items):
+    """
+    Process contiguous blocks of items in parallel threads.
+
+    The items are split into one block per worker. The first block is processed in the
+    calling thread while the others run in the shared pool; blocks the pool has not
+    started yet, e.g. because another computation occupies it, are processed in the
+    calling thread as well.
+
+    Args:
+        process_block (function): Called as process_block(start, end) for each block of item indices.
+        num_items (int): Number of items to be processed.
+    """
+    num_blocks = min(NUM_WORKERS, num_items)
+    if num_blocks <= 1:
+        if num_items > 0:
+            process_block(0, num_items)
+        return
+
+    bounds = [i * num_items // num_blocks for i in range(num_blocks + 1)]
+    blocks = list(zip(bounds[:-1], bounds[1:]))
+    futures = [_executor.submit(process_block, start, end) for start, end in blocks[1:]]
+    process_block(*blocks[0])
+    for future, (start, end) in zip(futures, blocks[1:]):
+        if future.cancel():
+            process_block(start, end)
+        else:
+            future.result()
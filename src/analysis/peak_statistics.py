@@ -1,37 +1,51 @@
 import numpy as np
 
+# Record layout of the per-channel statistics returned by compute_channel_statistics
+CHANNEL_STATISTICS_DTYPE = np.dtype([
+    ('channel', 'i4'),
+    ('mean', 'f4'),
+    ('std', 'f4'),
+    ('min', 'f4'),
+    ('max', 'f4'),
+    ('rms', 'f4')
+])
+
 def compute_channel_statistics(data):
     """
     Compute basic statistics for each channel in the electrophysiology data.
 
-    This function calculates the mean and standard deviation for each channel
-    in the input data.
+    This function calculates the mean, standard deviation, minimum, maximum and
+    root mean square of each channel, vectorized over all channels at once.
 
     Args:
         data (numpy.ndarray): The electrophysiology data with shape (samples, channels).
 
     Returns:
-        list: A list of dictionaries, where each dictionary contains statistics
-              for a single channel. The keys in each dictionary are:
+        numpy.ndarray: A structured array with one record per channel and the fields
+              of CHANNEL_STATISTICS_DTYPE:
               - 'channel': The channel number (0-indexed)
               - 'mean': The mean value of the channel data
               - 'std': The standard deviation of the channel data
+              - 'min': The minimum value of the channel data
+              - 'max': The maximum value of the channel data
+              - 'rms': The root mean square of the channel data
 
     Example:
         >>> data = np.array([[1, 2], [3, 4], [5, 6]])
         >>> stats = compute_channel_statistics(data)
-        >>> print(stats)
-        [{'channel': 0, 'mean': 3.0, 'std': 2.0}, {'channel': 1, 'mean': 4.0, 'std': 2.0}]
+        >>> print(stats[['channel', 'mean', 'std']])
+        [(0, 3., 1.6329932) (1, 4., 1.6329932)]
     """
-    channel_stats = []
-    for channel in range(data.shape[1]):
-        channel_data = data[:, channel]
-        stats = {
-            'channel': channel,
-            'mean': np.mean(channel_data),
-            'std': np.std(channel_data)
-        }
-        channel_stats.append(stats)
+    channel_stats = np.empty(data.shape[1], dtype=CHANNEL_STATISTICS_DTYPE)
+    channel_stats['channel'] = np.arange(data.shape[1])
+    mean = np.mean(data, axis=0, dtype=np.float64)
+    std = np.std(data, axis=0, dtype=np.float64)
+    channel_stats['mean'] = mean
+    channel_stats['std'] = std
+    channel_stats['min'] = np.min(data, axis=0)
+    channel_stats['max'] = np.max(data, axis=0)
+    # rms**2 = mean**2 + std**2, which avoids squaring a copy of the data
+    channel_stats['rms'] = np.sqrt(np.square(mean) + np.square(std))
     return channel_stats
 
 def compute_peak_statistics(data, peaks, time, sampling_rate):
@@ -50,7 +64,6 @@ def compute_peak_statistics(data, peaks, time, sampling_rate):
     """
     statistics = []
     total_time = time[-1] - time[0]
-    print(sampling_rate)
     for channel, channel_peaks in enumerate(peaks):
         if len(channel_peaks) > 1:
             peak_amplitudes = data[channel_peaks, channel]
@@ -1,6 +1,32 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import signal
 from scipy.signal import find_peaks  # Add this import
+from .parallel import run_in_blocks
+
+def _filter_channels(sos, data):
+    """
+    Apply a zero-phase filter in second-order sections to every channel.
+
+    Channels are filtered independently, so they are split into contiguous
+    blocks that are processed in parallel threads (SciPy releases the GIL
+    while filtering).
+
+    Args:
+    data (numpy.ndarray): 2D array of voltage data (samples x channels)
+    sos (numpy.ndarray): Filter coefficients in second-order sections
+
+    Returns:
+    numpy.ndarray: Filtered data with the same dtype as the input
+    """
+    filtered_data = np.empty(data.shape, dtype=data.dtype)
+
+    def filter_block(start, end):
+        filtered_data[:, start:end] = signal.sosfiltfilt(sos, data[:, start:end], axis=0)
+
+    run_in_blocks(filter_block, data.shape[1])
+
+    return filtered_data
 
 def apply_filter(data, lowcut=0.5, highcut=50, fs=1000, order=5):
     """
@@ -19,13 +45,8 @@ def apply_filter(data, lowcut=0.5, highcut=50, fs=1000, order=5):
     nyq = 0.5 * fs
     low = lowcut / nyq
     high = highcut / nyq
-    b, a = signal.butter(order, [low, high], btype='band')
-    
-    filtered_data = np.zeros_like(data)
-    for i in range(data.shape[1]):
-        filtered_data[:, i] = signal.filtfilt(b, a, data[:, i])
-    
-    return filtered_data
+    sos = signal.butter(order, [low, high], btype='band', output='sos')
+    return _filter_channels(sos, data)
 
 def apply_notch_filter(data, fs, freq, q=30):
     """
@@ -43,7 +64,7 @@ def apply_notch_filter(data, fs, freq, q=30):
     nyq = 0.5 * fs
     freq = freq / nyq
     b, a = signal.iirnotch(freq, q)
-    return signal.filtfilt(b, a, data, axis=0)
+    return _filter_channels(signal.tf2sos(b, a), data)
 
 def apply_lowpass_filter(data, fs, freq, order=2):
     """
@@ -60,8 +81,8 @@ def apply_lowpass_filter(data, fs, freq, order=2):
     """
     nyq = 0.5 * fs
     normal_cutoff = freq / nyq
-    b, a = signal.butter(order, normal_cutoff, btype='low', analog=False)
-    return signal.filtfilt(b, a, data, axis=0)
+    sos = signal.butter(order, normal_cutoff, btype='low', analog=False, output='sos')
+    return _filter_channels(sos, data)
 
 def apply_highpass_filter(data, fs, freq, order=2):
     """
@@ -78,8 +99,8 @@ def apply_highpass_filter(data, fs, freq, order=2):
     """
     nyq = 0.5 * fs
     normal_cutoff = freq / nyq
-    b, a = signal.butter(order, normal_cutoff, btype='high', analog=False)
-    return signal.filtfilt(b, a, data, axis=0)
+    sos = signal.butter(order, normal_cutoff, btype='high', analog=False, output='sos')
+    return _filter_channels(sos, data)
 
 def detect_peaks(data, sampling_rate, threshold, min_distance=0.5, detect_positive=False, window_size=None):
     """
@@ -119,14 +140,76 @@ def extract_peak_windows(data, peak_indices, window_size):
         window_size (int): Size of the window around each peak (in samples).
 
     Returns:
-        numpy.ndarray: Array of peak windows.
+        numpy.ndarray: Array of peak windows, in single precision.
     """
     half_window = window_size // 2
-    peak_windows = []
-    for peak in peak_indices:
-        start = max(0, peak - half_window)
-        end = min(len(data), peak + half_window)
-        window = data[start:end]
-        if len(window) == window_size:
-            peak_windows.append(window)
-    return np.array(peak_windows)
\ No newline at end of file
+    peak_indices = np.asarray(peak_indices)
+    # Only windows that fit entirely inside the signal are kept
+    valid = (peak_indices >= half_window) & (peak_indices + half_window <= len(data))
+    if 2 * half_window != window_size or not valid.any():
+        return np.empty((0, 2 * half_window), dtype=np.float32)
+    # Rows of a strided view of all windows are gathered, without building an index per sample
+    windows = sliding_window_view(data, window_size)
+    return windows[peak_indices[valid] - half_window].astype(np.float32, copy=False)
+
+def detect_peaks_all_channels(data, sampling_rate, threshold, window_size, min_distance=0.5, detect_positive=False):
+    """
+    Detect peaks and extract the windows around them in all channels of data.
+
+    Peak windows for all channels are gathered from the 2D array in a single
+    indexing operation and then split per channel.
+
+    Args:
+        data (numpy.ndarray): 2D array of voltage data (samples x channels).
+        sampling_rate (float): Sampling rate of the data in Hz.
+        threshold (float): Minimum absolute height of peaks.
+        window_size (int): Size of the window around each peak (in samples).
+        min_distance (float): Minimum distance between peaks in seconds.
+        detect_positive (bool): If True, detect positive peaks; if False, detect negative peaks.
+
+    Returns:
+        tuple: (peaks, peak_windows, avg_peak_windows), lists with one entry per channel:
+            - peaks: array of peak indices
+            - peak_windows: 2D single-precision array of peak windows (peaks x window_size)
+            - avg_peak_windows: average peak window, or None if the channel has no windows
+    """
+    num_channels = data.shape[1]
+    # A single reduction over all channels finds those that ever reach the threshold;
+    # channels that don't cannot contain peaks and skip find_peaks entirely
+    if detect_positive:
+        has_peaks = np.max(data, axis=0) >= threshold
+    else:
+        has_peaks = np.min(data, axis=0) <= -threshold
+
+    peaks = [np.empty(0, dtype=np.intp)] * num_channels
+
+    def find_block_peaks(start, end):
+        for channel in np.flatnonzero(has_peaks[start:end]) + start:
+            peaks[channel] = detect_peaks(data[:, channel], sampling_rate, threshold, min_distance, detect_positive, window_size)
+
+    # Channels are independent and find_peaks runs its search without the GIL,
+    # so blocks of channels are searched in parallel threads
+    run_in_blocks(find_block_peaks, num_channels)
+
+    all_peaks = np.concatenate(peaks)
+    peak_channels = np.repeat(np.arange(num_channels), [len(p) for p in peaks])
+
+    half_window = window_size // 2
+    valid = (all_peaks >= half_window) & (all_peaks + half_window <= data.shape[0])
+    if 2 * half_window != window_size or not valid.any():
+        valid[:] = False
+        windows = np.empty((0, 2 * half_window), dtype=np.float32)
+    else:
+        # Windows are gathered as (start, channel) rows of a strided view of all windows,
+        # without building an index per sample
+        all_windows = sliding_window_view(data, window_size, axis=0)
+        windows = all_windows[all_peaks[valid] - half_window, peak_channels[valid]].astype(np.float32, copy=False)
+
+    window_counts = np.bincount(peak_channels[valid], minlength=num_channels)
+    peak_windows = np.split(windows, np.cumsum(window_counts)[:-1])
+    # The averages of all channels are reduced into rows of one preallocated buffer
+    averages = np.empty((num_channels, windows.shape[1]), dtype=np.float32)
+    avg_peak_windows = [np.mean(channel_windows, axis=0, dtype=np.float32, out=average) if len(channel_windows) > 0 else None
+                        for channel_windows, average in zip(peak_windows, averages)]
+
+    return peaks, peak_windows, avg_peak_windows
@@ -1,14 +1,32 @@
+import weakref
 import numpy as np
 from pathlib import Path
 from typing import Tuple, Union
 from intan_reader import IntanReader
 
-def load_data(file_path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
+# Read-only memory maps of .npy files, keyed by (path, mtime). Entries live as
+# long as something still references the mapped array.
+_mmap_cache = weakref.WeakValueDictionary()
+
+def load_data(file_path: Union[str, Path], sampling_rate: float = None, dtype=np.float32) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Load data from either a NumPy file (.npy) or Intan file (.rhd).
+    Load data from a NumPy file (.npy or .npz) or Intan file (.rhd).
+
+    NumPy files are memory-mapped read-only rather than read into memory, and
+    reloading an unchanged file returns the existing mapping. Files stored in a
+    different dtype are converted into an in-memory copy. Callers that need to
+    modify the data in place must copy it first.
+
+    NumPy archives, such as those written by np.savez_compressed, cannot be
+    memory-mapped and are read into memory. The array stored under 'data' is
+    loaded, or the first array if there is no such key.
     
     Args:
-        file_path (str or Path): Path to the data file (.npy or .rhd)
+        file_path (str or Path): Path to the data file (.npy, .npz or .rhd)
+        sampling_rate (float): Sampling rate in Hz used to build the time axis of
+            NumPy files. If None, the time axis holds sample indices.
+        dtype (numpy.dtype): Data type of the returned data. Single precision is
+            enough for ADC-resolution recordings; pass np.float64 for double precision.
     
     Returns:
         tuple: (data, time), where:
@@ -24,9 +42,24 @@ def load_data(file_path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    if file_path.suffix == '.npy':
-        data = np.load(file_path)
-        time = np.arange(data.shape[0])
+    if file_path.suffix in ('.npy', '.npz'):
+        if file_path.suffix == '.npy':
+            key = (str(file_path.resolve()), file_path.stat().st_mtime_ns)
+            data = _mmap_cache.get(key)
+            if data is None:
+                data = np.lib.format.open_memmap(file_path, mode='r')
+                _mmap_cache[key] = data
+        else:
+            with np.load(file_path) as archive:
+                data = archive['data' if 'data' in archive.files else archive.files[0]]
+        # Files already stored in the requested dtype stay memory-mapped
+        data = data.astype(dtype, copy=False)
+        if sampling_rate is None:
+            time = np.arange(data.shape[0])
+        else:
+            # Scale in place so the time axis is built with a single allocation
+            time = np.arange(data.shape[0], dtype=np.float64)
+            time /= sampling_rate
         return data, time
         
     elif file_path.suffix == '.rhd':
@@ -36,7 +69,7 @@ def load_data(file_path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
         
         # Extract amplifier data and convert to numpy array
         # The shape will be (samples x channels)
-        data = np.array(result.data.amplifier_data).T
+        data = np.asarray(result.data.amplifier_data, dtype=dtype).T
         
         # Create time array based on sampling rate
         sampling_rate = result.header.sample_rate
@@ -47,4 +80,4 @@ def load_data(file_path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
         
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}. "
-                        f"Supported formats are: .npy, .rhd")
\ No newline at end of file
+                        f"Supported formats are: .npy, .npz, .rhd")
\ No newline at end of file
@@ -2,6 +2,22 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from .control_panel import ControlPanel
 
+# Options of the dark ttk styles, applied by ElectrophysiologyAnalyzer.create_styles
+_STYLE_OPTIONS = {
+    "Dark.TFrame": dict(background="#000000"),
+    "Dark.TButton": dict(background="#333333", foreground="white", font=("Arial", 12)),
+    "Dark.TLabel": dict(background="#000000", foreground="white", font=("Arial", 12)),
+    "Dark.TEntry": dict(fieldbackground="#333333", foreground="white", font=("Arial", 14)),
+    "Dark.TCheckbutton": dict(background="#000000", foreground="white", font=("Arial", 12)),
+    "Dark.Treeview": dict(background="#1E1E1E", foreground="white", fieldbackground="#1E1E1E",
+                          font=("Arial", 12), rowheight=22),
+    "Dark.Treeview.Heading": dict(background="#333333", foreground="white", font=("Arial", 12, "bold")),
+}
+_STYLE_MAPS = {
+    "Dark.TButton": dict(background=[('active', '#4A6984')], foreground=[('active', 'white')]),
+    "Dark.Treeview": dict(background=[('selected', '#4A6984')]),
+}
+
 class ElectrophysiologyAnalyzer(tk.Tk):
     """
     Main application window for the Electrophysiology Data Analyzer.
@@ -33,28 +49,20 @@ class ElectrophysiologyAnalyzer(tk.Tk):
         self.create_widgets()
 
     def create_styles(self):
+        """
+        Configure the dark ttk styles used by all panels.
+
+        Styles belong to the Tcl interpreter, so configuring them is skipped if this
+        interpreter has already been styled. Each style is configured with one call.
+        """
         self.style = ttk.Style()
+        if self.style.lookup("Dark.TFrame", "background") == _STYLE_OPTIONS["Dark.TFrame"]["background"]:
+            return
         self.style.theme_use('default')
-        self.style.configure("Dark.TFrame", background="#000000")
-        self.style.configure("Dark.TButton", background="#333333", foreground="white", font=("Arial", 12))
-        self.style.map("Dark.TButton",
-                       background=[('active', '#4A6984')],
-                       foreground=[('active', 'white')])
-        self.style.configure("Dark.TLabel", background="#000000", foreground="white", font=("Arial", 12))
-        self.style.configure("Dark.TEntry", fieldbackground="#333333", foreground="white", font=("Arial", 14))
-        self.style.configure("Dark.TCheckbutton", background="#000000", foreground="white", font=("Arial", 12))
-        
-        # Configure Treeview style
-        self.style.configure("Dark.Treeview",
-                             background="#1E1E1E",
-                             foreground="white",
-                             fieldbackground="#1E1E1E",
-                             font=("Arial", 12))
-        self.style.configure("Dark.Treeview.Heading",
-                             background="#333333",
-                             foreground="white",
-                             font=("Arial", 12, "bold"))
-        self.style.map("Dark.Treeview", background=[('selected', '#4A6984')])
+        for style, options in _STYLE_OPTIONS.items():
+            self.style.configure(style, **options)
+        for style, options in _STYLE_MAPS.items():
+            self.style.map(style, **options)
 
     def create_menu(self):
         menubar = tk.Menu(self)
@@ -70,7 +78,9 @@ class ElectrophysiologyAnalyzer(tk.Tk):
         file_menu.add_separator()
         file_menu.add_command(label="Clear All Data", command=self.clear_all_data)  # Add this line
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        # Destroying the window (rather than only leaving the main loop) releases the
+        # plotted data and stops the panels' worker threads
+        file_menu.add_command(label="Exit", command=self.destroy)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -101,8 +111,8 @@ class ElectrophysiologyAnalyzer(tk.Tk):
         Open a file dialog to select and load data files.
         """
         file_types = [
-            ('All supported files', '*.npy;*.rhd'),
-            ('NumPy files', '*.npy'),
+            ('All supported files', '*.npy;*.npz;*.rhd'),
+            ('NumPy files', '*.npy;*.npz'),
             ('Intan RHD files', '*.rhd'),
             ('All files', '*.*')
         ]
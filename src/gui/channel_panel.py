@@ -31,8 +31,8 @@ class ChannelPanel(ttk.Frame):
 
     def update_channel_list(self):
         self.channel_listbox.delete(0, tk.END)
-        for original_channel in self.data_manager.channel_mapping:
-            self.channel_listbox.insert(tk.END, f"Channel {original_channel}")
+        # Insert all labels with a single Tcl call
+        self.channel_listbox.insert(tk.END, *self.data_manager.channel_mapping.values())
         # Select only the first channel by default
         self.channel_listbox.select_set(0)
         self.on_select(None)
@@ -1,13 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from src.data_handling.data_loader import load_data
-from src.analysis.signal_processing import apply_notch_filter, apply_lowpass_filter, apply_highpass_filter, detect_peaks, extract_peak_windows
-from src.analysis.artifact_detection import detect_artifacts_all_channels
 import numpy as np
 from .plot_panel import PlotPanel
-from src.analysis.peak_statistics import compute_peak_statistics, compute_channel_statistics
+from src.analysis.peak_statistics import compute_peak_statistics
 from .statistics_panel import StatisticsPanel
-import pandas as pd
 from .data_manager import DataManager
 from .filter_panel import FilterPanel
 from .channel_panel import ChannelPanel
@@ -39,6 +37,9 @@ class ControlPanel(ttk.Frame):
 
         # Initialize data manager first
         self.data_manager = DataManager(self.update_callback)
+        # Data files are read in this worker thread, keeping the GUI responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_load = None
         
         # Configure the frame
         self.configure(style="Dark.TFrame")
@@ -85,8 +86,8 @@ class ControlPanel(ttk.Frame):
         """
         if filetypes is None:
             filetypes = [
-                ('All supported files', '*.npy;*.rhd'),
-                ('NumPy files', '*.npy'),
+                ('All supported files', '*.npy;*.npz;*.rhd'),
+                ('NumPy files', '*.npy;*.npz'),
                 ('Intan RHD files', '*.rhd'),
                 ('All files', '*.*')
             ]
@@ -99,11 +100,53 @@ class ControlPanel(ttk.Frame):
         if file_path:
             try:
                 sampling_rate = self.filter_panel.get_sampling_rate()
-                self.data_manager.load_data(sampling_rate, file_path)
-                self.channel_panel.update_channel_list()
-                self.update_callback()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load data: {str(e)}")
+                return
+            # The file is read in the worker thread; only the widgets are updated in the Tk thread
+            self.winfo_toplevel().configure(cursor="watch")
+            # A previous read that has not started yet is superseded by this one
+            if self._pending_load is not None:
+                self._pending_load.cancel()
+            future = self._executor.submit(load_data, file_path, sampling_rate)
+            self._pending_load = future
+
+            def hand_over(done):
+                if not done.cancelled():
+                    self.after(0, self._on_data_loaded, done, sampling_rate)
+
+            future.add_done_callback(hand_over)
+
+    def _on_data_loaded(self, future, sampling_rate):
+        """
+        Show data read by load_data once the worker thread has finished.
+
+        Args:
+            future (concurrent.futures.Future): The finished read, returning (data, time).
+            sampling_rate (float): The sampling rate in Hz the data was read with.
+        """
+        # A superseded read that was already running still completes; its data is dropped
+        if future is not self._pending_load:
+            return
+        self._pending_load = None
+        self.winfo_toplevel().configure(cursor="")
+        try:
+            data, time = future.result()
+            self.data_manager.set_data(data, time, sampling_rate)
+            self.channel_panel.update_channel_list()
+            self.update_callback()
+            self.plot_panel.on_new_dataset()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
+
+    def destroy(self):
+        """
+        Destroy the panel, dropping a queued data file read.
+        """
+        if self._pending_load is not None:
+            self._pending_load.cancel()
+        self._executor.shutdown(wait=False)
+        super().destroy()
 
     def save_statistics_to_excel(self):
         """Save the current channel statistics to an Excel file."""
@@ -141,13 +184,13 @@ class ControlPanel(ttk.Frame):
             start_idx = np.searchsorted(self.data_manager.time, self.selected_range[0])
             end_idx = np.searchsorted(self.data_manager.time, self.selected_range[1])
 
-            self.data_manager.trim_data(start_idx, end_idx)
-
-            # Disable span selector and update plot
+            # Disable span selector first, so that the single update triggered by
+            # trim_data redraws the plot without it
             self.plot_panel.span_selector_active = False
             self.plot_panel.remove_span_selector()
             self.toggle_span_button.config(text="Enable Span Selector")
-            self.update_callback()
+
+            self.data_manager.trim_data(start_idx, end_idx)
 
             messagebox.showinfo("Info", "Data has been trimmed successfully.")
 
@@ -163,11 +206,35 @@ class ControlPanel(ttk.Frame):
             if hasattr(self, 'plot_panel'):  # Only update if plot_panel exists
                 self.plot_panel.update_plot(data_dict)
             if hasattr(self, 'statistics_panel'):  # Only update if statistics_panel exists
-                self.statistics_panel.update_statistics(
-                    channel_statistics=self.data_manager.channel_statistics,
-                    peak_statistics=self.data_manager.peak_statistics,
-                    channel_mapping=self.data_manager.channel_mapping
-                )
+                if self.data_manager.peaks is not None and self.data_manager.peak_statistics is None \
+                        and not self.data_manager.use_cached_peak_statistics():
+                    # Statistics of newly detected peaks are computed off the Tk thread, from
+                    # inputs captured now; they are discarded if the data changes meanwhile
+                    inputs = self.data_manager.peak_statistics_inputs()
+                    self.statistics_panel.request_update(compute_peak_statistics, *inputs,
+                                                         on_result=lambda peak_statistics: self._on_peak_statistics(inputs, peak_statistics))
+                else:
+                    self.statistics_panel.update_statistics(
+                        channel_statistics=self.data_manager.channel_statistics,
+                        peak_statistics=self.data_manager.peak_statistics,
+                        channel_mapping=self.data_manager.channel_mapping
+                    )
+
+    def _on_peak_statistics(self, inputs, peak_statistics):
+        """
+        Store peak statistics computed in the worker thread and return what to display.
+
+        Args:
+            inputs (tuple): The inputs captured by DataManager.peak_statistics_inputs.
+            peak_statistics (list): The statistics computed from them.
+
+        Returns:
+            tuple: (channel_statistics, peak_statistics, channel_mapping), or None if the
+                data changed since the inputs were captured.
+        """
+        if not self.data_manager.store_peak_statistics(inputs, peak_statistics):
+            return None
+        return self.data_manager.channel_statistics, self.data_manager.peak_statistics, self.data_manager.channel_mapping
 
     def save_comprehensive_peak_data(self):
         """Save comprehensive peak data to a CSV file."""
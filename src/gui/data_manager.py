@@ -1,9 +1,8 @@
 import numpy as np
 from tkinter import filedialog, messagebox
-from src.data_handling.data_loader import load_data
 from src.analysis.peak_statistics import compute_channel_statistics, compute_peak_statistics
 import pandas as pd
-import csv
+from .result_cache import DataResultCache
 
 class DataManager:
     """
@@ -18,11 +17,11 @@ class DataManager:
         time (numpy.ndarray): Time points corresponding to the data.
         sampling_rate (float): Sampling rate of the data in Hz.
         artifacts (numpy.ndarray): Detected artifacts in the data.
-        peaks (list): Detected peaks for each channel.
+        peaks (tuple): Detected peaks for each channel, as views into one flat array.
         peak_windows (list): Extracted peak windows for each channel.
         avg_peak_windows (list): Average peak windows for each channel.
-        channel_mapping (list): Mapping of original channel indices to current indices.
-        channel_statistics (dict): Statistics for each channel.
+        channel_mapping (dict): Mapping of current channel indices to channel labels.
+        channel_statistics (numpy.ndarray): Structured array of statistics for each channel.
         peak_statistics (dict): Statistics for detected peaks.
         selected_channels (list): Currently selected channels for analysis.
     """
@@ -35,35 +34,71 @@ class DataManager:
             update_callback (function): Callback function to update the GUI.
         """
         self.update_callback = update_callback
+        # Recent peak statistics of the data, keyed by peak contents and sampling rate
+        self._peak_statistics_cache = DataResultCache()
+        self._peak_views = None
         self.clear_all_data()
 
-    def load_data(self, sampling_rate: float, file_path: str):
+    def set_data(self, data, time, sampling_rate: float):
         """
-        Load data from a file and initialize data structures.
-        
+        Initialize data structures with newly loaded data.
+
+        The file is read with data_handling.data_loader.load_data, which can run
+        outside the GUI thread; only this method is called from it.
+
         Args:
+            data (numpy.ndarray): 2D array of voltage data (samples x channels)
+            time (numpy.ndarray): Time points corresponding to the data
             sampling_rate (float): The sampling rate in Hz
-            file_path (str): Path to the data file
         """
-        try:
-            self.data, self.time = load_data(file_path)
-            self.sampling_rate = sampling_rate
-            self.original_data = self.data.copy()
-            self.original_time = self.time.copy()
-            
-            # Initialize channel mapping
-            self.channel_mapping = {i: f'Channel {i+1}' for i in range(self.data.shape[1])}
-            
-            # Reset all processed data
-            self.filtered_data = None
-            self.artifacts = None
-            self.peaks = None
-            self.peak_windows = None
-            self.channel_statistics = None
-            self.peak_statistics = None
-            
-        except Exception as e:
-            raise Exception(f"Error loading data: {str(e)}")
+        self.data, self.time = data, time
+        self.sampling_rate = sampling_rate
+        # The loaded array is a read-only memory map and is never modified
+        # in place, so the originals can share it instead of copying
+        self.original_data = self.data
+        self.original_time = self.time
+        
+        # Initialize channel mapping
+        self.channel_mapping = {i: f'Channel {i+1}' for i in range(self.data.shape[1])}
+        self._channel_pos = {label: i for i, label in self.channel_mapping.items()}
+        
+        # Reset all processed data
+        self.filtered_data = None
+        self.artifacts = None
+        self.peaks = None
+        self.peak_windows = None
+        self.avg_peak_windows = None
+        self.channel_statistics = None
+        self.peak_statistics = None
+        self.selected_channels = []
+
+    @property
+    def peaks(self):
+        """
+        Detected peaks for each channel.
+
+        Peaks are stored as a single flat index array plus per-channel offsets;
+        the returned tuple holds views into that array. It is built once per set of
+        peaks, so repeated reads return the same object.
+
+        Returns:
+            tuple: Arrays of peak indices for each channel, or None if no peaks are detected.
+        """
+        if self._peak_flat is None:
+            return None
+        if self._peak_views is None:
+            self._peak_views = tuple(np.split(self._peak_flat, self._peak_offsets[1:-1]))
+        return self._peak_views
+
+    @peaks.setter
+    def peaks(self, peaks):
+        if peaks is None:
+            self._peak_flat = None
+            self._peak_offsets = None
+        else:
+            self._peak_offsets = np.concatenate(([0], np.cumsum([len(p) for p in peaks], dtype=np.intp)))
+            self._peak_flat = np.concatenate(peaks) if len(peaks) > 0 else np.empty(0, dtype=np.intp)
+        self._peak_views = None
 
     def update_channel_statistics(self):
         """
@@ -78,8 +113,60 @@ class DataManager:
         """
         Update the peak statistics if peaks are detected.
         """
-        if self.peaks is not None and self.sampling_rate is not None:
-            self.peak_statistics = compute_peak_statistics(self.data, self.peaks, self.time, self.sampling_rate)
+        if self.peaks is not None and self.sampling_rate is not None and not self.use_cached_peak_statistics():
+            inputs = self.peak_statistics_inputs()
+            self.store_peak_statistics(inputs, compute_peak_statistics(*inputs))
+
+    def _peak_statistics_key(self):
+        """Key of the current peak statistics in the cache of the current data: peak contents and sampling rate."""
+        # Keyed on contents, so that detecting the same peaks again finds the statistics
+        return (self._peak_flat.tobytes(), self._peak_offsets.tobytes(), self.sampling_rate)
+
+    def use_cached_peak_statistics(self):
+        """
+        Set the peak statistics from the cache if they were computed recently for the current peaks.
+
+        Returns:
+            bool: True if cached statistics were found.
+        """
+        cached = self._peak_statistics_cache.get(self.data, self._peak_statistics_key())
+        if cached is None:
+            return False
+        self.peak_statistics = cached
+        return True
+
+    def peak_statistics_inputs(self):
+        """
+        Capture the inputs of the peak statistics.
+
+        The peak statistics can then be computed with compute_peak_statistics(*inputs)
+        in a worker thread, which never reads the DataManager while the Tk thread
+        trims or replaces the data.
+
+        Returns:
+            tuple: (data, peaks, time, sampling_rate)
+        """
+        return self.data, self.peaks, self.time, self.sampling_rate
+
+    def store_peak_statistics(self, inputs, peak_statistics):
+        """
+        Store peak statistics computed from inputs captured by peak_statistics_inputs.
+
+        Statistics of a data set that has since been trimmed, filtered or replaced are discarded.
+
+        Args:
+            inputs (tuple): The captured inputs.
+            peak_statistics (list): The statistics computed from them.
+
+        Returns:
+            bool: True if the statistics were stored.
+        """
+        data, peaks, time, sampling_rate = inputs
+        if self.data is not data or self.peaks is not peaks or self.time is not time or self.sampling_rate != sampling_rate:
+            return False
+        self.peak_statistics = peak_statistics
+        self._peak_statistics_cache.put(self.data, self._peak_statistics_key(), peak_statistics)
+        return True
 
     def save_statistics_to_excel(self):
         """
@@ -95,17 +182,16 @@ class DataManager:
             return
 
         try:
-            with pd.ExcelWriter(file_path) as writer:
+            channel_labels = list(self.channel_mapping.values())
+            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
                 channel_df = pd.DataFrame(self.channel_statistics)
-                channel_df['Original Channel'] = self.channel_mapping
-                channel_df = channel_df.set_index('Original Channel')
-                channel_df.to_excel(writer, sheet_name='Channel Statistics')
+                channel_df.insert(0, 'Original Channel', channel_labels)
+                channel_df.to_excel(writer, sheet_name='Channel Statistics', index=False)
 
                 if self.peak_statistics:
                     peak_df = pd.DataFrame(self.peak_statistics)
-                    peak_df['Original Channel'] = self.channel_mapping
-                    peak_df = peak_df.set_index('Original Channel')
-                    peak_df.to_excel(writer, sheet_name='Peak Statistics')
+                    peak_df.insert(0, 'Original Channel', channel_labels)
+                    peak_df.to_excel(writer, sheet_name='Peak Statistics', index=False)
                 else:
                     messagebox.showwarning("Warning", "No peak statistics available. Only channel statistics will be saved.")
 
@@ -140,6 +226,7 @@ class DataManager:
             start_idx (int): Starting index for trimming.
             end_idx (int): Ending index for trimming.
         """
+        num_samples = self.data.shape[0]
         self.data = self.data[start_idx:end_idx]
         self.time = self.time[start_idx:end_idx]
 
@@ -147,48 +234,107 @@ class DataManager:
             self.artifacts = self.artifacts[start_idx:end_idx]
 
         if self.peaks is not None:
-            self.peaks = [np.array([p for p in channel_peaks if start_idx <= p < end_idx]) - start_idx for channel_peaks in self.peaks]
+            # Peaks are sorted within each channel, so shifting every channel by the number of
+            # samples makes the flat array sorted and one searchsorted finds the kept slices
+            channel_starts = np.arange(len(self._peak_offsets) - 1) * num_samples
+            keys = self._peak_flat + np.repeat(channel_starts, np.diff(self._peak_offsets))
+            lo = np.searchsorted(keys, channel_starts + start_idx)
+            hi = np.searchsorted(keys, channel_starts + end_idx)
+            bounds = np.column_stack((lo, hi)) - self._peak_offsets[:-1, np.newaxis]
+
+            kept = (self._peak_flat >= start_idx) & (self._peak_flat < end_idx)
+            self._peak_flat = self._peak_flat[kept] - start_idx
+            self._peak_offsets = np.concatenate(([0], np.cumsum(hi - lo)))
+            self._peak_views = None
         else:
             self.peaks = None
 
-        if self.peak_windows is not None:
-            self.peak_windows = [windows[np.logical_and(start_idx <= peaks, peaks < end_idx)] for windows, peaks in zip(self.peak_windows, self.peaks)]
-        else:
-            self.peak_windows = None
-
         if self.avg_peak_windows is not None:
-            self.avg_peak_windows = [np.mean(windows, axis=0) if len(windows) > 0 else None for windows in self.peak_windows]
+            self.avg_peak_windows = [self._trimmed_average(avg_window, windows, lo, hi)
+                                     for avg_window, windows, (lo, hi) in zip(self.avg_peak_windows, self.peak_windows, bounds)]
         else:
             self.avg_peak_windows = None
 
+        if self.peak_windows is not None:
+            self.peak_windows = [windows[lo:hi] for windows, (lo, hi) in zip(self.peak_windows, bounds)]
+        else:
+            self.peak_windows = None
+
         self.update_channel_statistics()
         self.update_peak_statistics()
         self.update_callback()
 
+    @staticmethod
+    def _trimmed_average(avg_window, windows, lo, hi):
+        """
+        Get the average of windows[lo:hi] from the average of all windows.
+
+        Channels that keep all their windows reuse the existing average. Otherwise
+        the removed windows are subtracted from the running sum when there are
+        fewer of them than kept windows.
+
+        Args:
+            avg_window (numpy.ndarray): Average of all windows, or None if there are none.
+            windows (numpy.ndarray): Peak windows of the channel before trimming.
+            lo (int): Index of the first kept window.
+            hi (int): Index after the last kept window.
+
+        Returns:
+            numpy.ndarray: Average of the kept windows, or None if no window is kept.
+        """
+        num_windows = len(windows)
+        num_kept = hi - lo
+        if avg_window is None or num_kept <= 0:
+            return None
+        if num_kept == num_windows:
+            return avg_window
+        if num_kept < num_windows - num_kept:
+            return np.mean(windows[lo:hi], axis=0)
+        removed_sum = windows[:lo].sum(axis=0) + windows[hi:].sum(axis=0)
+        return (avg_window * num_windows - removed_sum) / num_kept
+
     def delete_channels(self, channels_to_delete):
         """
         Delete specified channels and update related attributes.
 
+        All channels are removed at once with a boolean column mask, so the data
+        is copied a single time regardless of how many channels are deleted.
+
         Args:
-            channels_to_delete (list): List of channel indices to delete.
-        """
-        channels_to_delete = sorted(channels_to_delete, reverse=True)
-        for channel in channels_to_delete:
-            index = self.channel_mapping.index(channel)
-            self.data = np.delete(self.data, index, axis=1)
-            if self.artifacts is not None:
-                self.artifacts = np.delete(self.artifacts, index, axis=1)
-            if self.peaks is not None:
-                del self.peaks[index]
-            if self.peak_windows is not None:
-                del self.peak_windows[index]
-            if self.avg_peak_windows is not None:
-                del self.avg_peak_windows[index]
-            del self.channel_mapping[index]
-
-        self.selected_channels = [ch for ch in self.selected_channels if ch not in channels_to_delete]
-        self.update_channel_statistics()
-        self.update_peak_statistics()
+            channels_to_delete (list): List of channel labels to delete.
+        """
+        keep = np.ones(len(self.channel_mapping), dtype=bool)
+        keep[[self._channel_pos[channel] for channel in channels_to_delete]] = False
+
+        self.data = self.data[:, keep]
+        if self.artifacts is not None:
+            self.artifacts = self.artifacts[:, keep]
+        if self.peaks is not None:
+            self.peaks = [peaks for peaks, kept in zip(self.peaks, keep) if kept]
+        if self.peak_windows is not None:
+            self.peak_windows = [windows for windows, kept in zip(self.peak_windows, keep) if kept]
+        if self.avg_peak_windows is not None:
+            self.avg_peak_windows = [window for window, kept in zip(self.avg_peak_windows, keep) if kept]
+        if self.channel_statistics is not None:
+            self.channel_statistics = self.channel_statistics[keep]
+        if self.peak_statistics is not None:
+            self.peak_statistics = [stats for stats, kept in zip(self.peak_statistics, keep) if kept]
+        self.channel_mapping = dict(enumerate(label for label, kept in zip(self.channel_mapping.values(), keep) if kept))
+        self._channel_pos = {label: i for i, label in self.channel_mapping.items()}
+
+        deleted = set(channels_to_delete)
+        self.selected_channels = [ch for ch in self.selected_channels if ch not in deleted]
+        if self.channel_statistics is not None:
+            # Deleting channels doesn't change the statistics of the remaining ones,
+            # only their position, so the existing entries are reused
+            self.channel_statistics['channel'] = np.arange(len(self.channel_statistics))
+        else:
+            self.update_channel_statistics()
+        if self.peak_statistics is not None:
+            # Same for peak statistics; the entries are copied since they may be cached
+            self.peak_statistics = [dict(stats, channel=position) for position, stats in enumerate(self.peak_statistics)]
+        else:
+            self.update_peak_statistics()
         self.update_callback()
 
     def keep_channels(self, channels_to_keep):
@@ -196,9 +342,10 @@ class DataManager:
         Keep only specified channels and delete the rest.
 
         Args:
-            channels_to_keep (list): List of channel indices to keep.
+            channels_to_keep (list): List of channel labels to keep.
         """
-        channels_to_delete = [ch for ch in self.channel_mapping if ch not in channels_to_keep]
+        channels_to_keep = set(channels_to_keep)
+        channels_to_delete = [ch for ch in self.channel_mapping.values() if ch not in channels_to_keep]
         self.delete_channels(channels_to_delete)
 
     def save_comprehensive_peak_data(self):
@@ -216,18 +363,26 @@ class DataManager:
             return
 
         try:
-            with open(file_path, 'w') as f:
-                f.write("Channel, Peak Time (s),Peak Amplitude (mV),Inter-Peak Distance (s)\n")
-                for channel, peaks in enumerate(self.peaks):
-                    peak_times = self.time[peaks]
-                    peak_amplitudes = self.data[peaks, channel]
-                    inter_peak_distances = np.diff(peak_times)
-                    
-                    for i, (time, amplitude) in enumerate(zip(peak_times, peak_amplitudes)):
-                        if i == 0:
-                            f.write(f"{self.channel_mapping[channel]},{time:.6f},{amplitude:.6f},\n")
-                        else:
-                            f.write(f"{self.channel_mapping[channel]},{time:.6f},{amplitude:.6f},{inter_peak_distances[i-1]:.6f}\n")
+            counts = np.diff(self._peak_offsets)
+            peak_channels = np.repeat(np.arange(len(counts)), counts)
+            peak_times = self.time[self._peak_flat]
+
+            # Distances are taken over the concatenated times in one pass, then the first
+            # peak of each channel, which has no previous peak, is left empty
+            distances = np.empty(len(peak_times))
+            np.subtract(peak_times[1:], peak_times[:-1], out=distances[1:])
+            first_peaks = self._peak_offsets[:-1]
+            distances[first_peaks[counts > 0]] = np.nan
+
+            channel_labels = np.array([self.channel_mapping[channel] for channel in range(len(counts))])
+            peak_data = pd.DataFrame({
+                'Channel': channel_labels[peak_channels],
+                'Peak Time (s)': peak_times,
+                'Peak Amplitude (mV)': self.data[self._peak_flat, peak_channels],
+                'Inter-Peak Distance (s)': distances
+            })
+            with open(file_path, 'w', newline='', buffering=1 << 20) as f:
+                peak_data.to_csv(f, index=False, float_format='%.6f')
             messagebox.showinfo("Success", f"Comprehensive peak data saved to {file_path}")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while saving the file: {str(e)}")
@@ -247,15 +402,22 @@ class DataManager:
             return
 
         try:
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                header = ['Channel', 'Peak Number'] + [f'V{i}' for i in range(len(self.peak_windows[0][0]))]
-                writer.writerow(header)
-
+            window_size = self.peak_windows[0].shape[1]
+            header = ['Channel', 'Peak Number'] + [f'V{i}' for i in range(window_size)]
+            # One row buffer sized for the channel with most peaks is reused for every
+            # channel; its first column holds the peak numbers
+            max_peaks = max(len(channel_windows) for channel_windows in self.peak_windows)
+            rows = np.empty((max_peaks, 1 + window_size))
+            rows[:, 0] = np.arange(max_peaks)
+            # A 1 MiB buffer keeps the row-by-row writes of np.savetxt from hitting the disk each time
+            with open(file_path, 'w', buffering=1 << 20) as f:
+                f.write(','.join(header) + '\n')
                 for channel, channel_windows in enumerate(self.peak_windows):
-                    for peak_number, window in enumerate(channel_windows):
-                        row = [self.channel_mapping[channel], peak_number] + list(window)
-                        writer.writerow(row)
+                    num_peaks = len(channel_windows)
+                    rows[:num_peaks, 1:] = channel_windows
+                    # The channel label is the same for every row, so it goes into the format string
+                    label = str(self.channel_mapping[channel]).replace('%', '%%')
+                    np.savetxt(f, rows[:num_peaks], delimiter=',', fmt=[f'{label},%d'] + ['%.6f'] * window_size)
 
             messagebox.showinfo("Success", f"Peak windows saved to {file_path}")
         except Exception as e:
@@ -270,7 +432,8 @@ class DataManager:
         self.peaks = None
         self.peak_windows = None
         self.avg_peak_windows = None
-        self.channel_mapping = []
+        self.channel_mapping = {}
+        self._channel_pos = {}
         self.channel_statistics = None
         self.peak_statistics = None
         self.selected_channels = []
@@ -1,8 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.analysis.signal_processing import apply_notch_filter, apply_lowpass_filter, apply_highpass_filter, detect_peaks, extract_peak_windows
+from src.analysis.signal_processing import apply_notch_filter, apply_lowpass_filter, apply_highpass_filter, detect_peaks_all_channels
 from src.analysis.artifact_detection import detect_artifacts_all_channels
-import numpy as np
+from .result_cache import DataResultCache
 
 class FilterPanel(ttk.Frame):
     """
@@ -23,6 +24,12 @@ class FilterPanel(ttk.Frame):
         super().__init__(parent, style="Dark.TFrame")
         self.data_manager = data_manager
         self.update_callback = update_callback
+        # Processing runs in this worker thread, one operation at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._busy = False
+        self._task = None
+        # Recent detection results, keyed by function, parameters and data identity
+        self._detection_cache = DataResultCache()
         self.create_widgets()
 
     def create_widgets(self):
@@ -112,75 +119,177 @@ class FilterPanel(ttk.Frame):
         if self.data_manager.data is None:
             messagebox.showerror("Error", "Please load data first.")
             return
+        if self._busy:
+            return
         try:
             if filter_type == 'notch':
                 freq = float(self.notch_entry.get())
-                self.data_manager.data = apply_notch_filter(self.data_manager.data, self.data_manager.sampling_rate, freq)
+                filter_fn = apply_notch_filter
             elif filter_type == 'lowpass':
                 freq = float(self.lowpass_entry.get())
-                self.data_manager.data = apply_lowpass_filter(self.data_manager.data, self.data_manager.sampling_rate, freq)
+                filter_fn = apply_lowpass_filter
             elif filter_type == 'highpass':
                 freq = float(self.highpass_entry.get())
-                self.data_manager.data = apply_highpass_filter(self.data_manager.data, self.data_manager.sampling_rate, freq)
-            self.update_callback()
+                filter_fn = apply_highpass_filter
         except ValueError:
             messagebox.showerror("Error", f"Invalid {filter_type} frequency.")
+            return
+
+        source = self.data_manager.data
+
+        def on_filtered(filtered_data):
+            # Results computed from data that has since been replaced are discarded
+            if self.data_manager.data is source:
+                self.data_manager.data = filtered_data
+                self.update_callback()
+
+        self._run_task(filter_fn, (source, self.data_manager.sampling_rate, freq), on_filtered,
+                       "An error occurred while filtering")
+
+    def _run_task(self, compute_fn, args, on_done, error_message, **kwargs):
+        """
+        Run a processing function in the worker thread and handle its result in the Tk thread.
+
+        Further operations are ignored until the task has finished.
+
+        Args:
+            compute_fn (function): The processing function.
+            args (tuple): Arguments passed to compute_fn.
+            on_done (function): Called in the Tk thread with the result of compute_fn.
+            error_message (str): Message shown if compute_fn raises an exception.
+            **kwargs: Keyword arguments passed to compute_fn.
+        """
+        self._busy = True
+        self.winfo_toplevel().configure(cursor="watch")
+        future = self._executor.submit(compute_fn, *args, **kwargs)
+        self._task = future
+
+        def hand_over(done):
+            # The worker never touches the widgets; the result is handed over to the Tk thread
+            if not done.cancelled():
+                self.after(0, self._finish_task, done, on_done, error_message)
+
+        future.add_done_callback(hand_over)
+
+    def _run_detection(self, compute_fn, source, args, on_done, error_message, **kwargs):
+        """
+        Run a detection function on the data, reusing the result of an identical recent run.
+
+        Re-running a detection with parameters that were used recently on the same
+        data (e.g. while trying out thresholds) then takes no time at all.
+
+        Args:
+            compute_fn (function): The detection function.
+            source (numpy.ndarray): The data, passed as first argument to compute_fn.
+            args (tuple): Further arguments passed to compute_fn.
+            on_done (function): Called in the Tk thread with the result of compute_fn.
+            error_message (str): Message shown if compute_fn raises an exception.
+            **kwargs: Keyword arguments passed to compute_fn.
+        """
+        key = (compute_fn, args, tuple(sorted(kwargs.items())))
+        cached = self._detection_cache.get(source, key)
+        if cached is not None:
+            on_done(cached)
+            return
+
+        def store_result(result):
+            self._detection_cache.put(source, key, result)
+            on_done(result)
+
+        self._run_task(compute_fn, (source,) + args, store_result, error_message, **kwargs)
+
+    def _finish_task(self, future, on_done, error_message):
+        """
+        Handle the result of a task started by _run_task.
+
+        Args:
+            future (concurrent.futures.Future): The finished task.
+            on_done (function): Called with the result of the task.
+            error_message (str): Message shown if the task raised an exception.
+        """
+        self._busy = False
+        self._task = None
+        self.winfo_toplevel().configure(cursor="")
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"{error_message}: {str(e)}")
+            return
+        on_done(result)
 
     def detect_artifacts(self):
         """Detect artifacts in the data using the specified threshold."""
         if self.data_manager.data is None:
             messagebox.showerror("Error", "Please load data first.")
             return
+        if self._busy:
+            return
         try:
             threshold = float(self.artifact_entry.get())
-            self.data_manager.artifacts = detect_artifacts_all_channels(self.data_manager.data, threshold=threshold)
+        except ValueError:
+            messagebox.showerror("Error", "Invalid artifact threshold.")
+            return
+
+        source = self.data_manager.data
+
+        def on_detected(artifacts):
+            if self.data_manager.data is not source:
+                return
+            self.data_manager.artifacts = artifacts
             
             # Ensure artifacts array has the same number of time points as the data
             if self.data_manager.artifacts.shape[0] != self.data_manager.data.shape[0]:
                 messagebox.showwarning("Warning", "Artifact detection result doesn't match data dimensions. Artifacts may not be displayed correctly.")
             
             self.update_callback()
-        except ValueError:
-            messagebox.showerror("Error", "Invalid artifact threshold.")
+
+        self._run_detection(detect_artifacts_all_channels, source, (), on_detected,
+                            "An error occurred during artifact detection", threshold=threshold)
 
     def detect_peaks(self):
         """Detect peaks in the data using the specified threshold and polarity."""
         if self.data_manager.data is None:
             messagebox.showerror("Error", "Please load data first.")
             return
+        if self._busy:
+            return
         try:
             threshold = float(self.peak_entry.get())
-            window_size = int(self.data_manager.sampling_rate * 0.1)  # 100ms window
-            detect_positive = self.peak_polarity_var.get()
-            
-            print(f"Threshold: {threshold}")
-            print(f"Data shape: {self.data_manager.data.shape}")
-            print(f"Sampling rate: {self.data_manager.sampling_rate}")
-            print(f"Detecting {'positive' if detect_positive else 'negative'} peaks")
-            
-            self.data_manager.peaks = []
-            self.data_manager.peak_windows = []
-            self.data_manager.avg_peak_windows = []
-            
-            for channel in range(self.data_manager.data.shape[1]):
-                channel_data = self.data_manager.data[:, channel]
-                channel_peaks = detect_peaks(channel_data, self.data_manager.sampling_rate, threshold, 
-                                             detect_positive=detect_positive, window_size=window_size)
-                
-                self.data_manager.peaks.append(channel_peaks)
-                
-                channel_peak_windows = extract_peak_windows(channel_data, channel_peaks, window_size)
-                self.data_manager.peak_windows.append(channel_peak_windows)
-                
-                if len(channel_peak_windows) > 0:
-                    self.data_manager.avg_peak_windows.append(np.mean(channel_peak_windows, axis=0))
-                else:
-                    self.data_manager.avg_peak_windows.append(None)
+        except ValueError:
+            messagebox.showerror("Error", "Invalid peak threshold.")
+            return
+        window_size = int(self.data_manager.sampling_rate * 0.1)  # 100ms window
+        detect_positive = self.peak_polarity_var.get()
+
+        source = self.data_manager.data
+
+        def on_detected(result):
+            if self.data_manager.data is not source:
+                return
+            peaks, peak_windows, avg_peak_windows = result
+
+            self.data_manager.peaks = peaks
+            self.data_manager.peak_windows = peak_windows
+            self.data_manager.avg_peak_windows = avg_peak_windows
+            # The statistics of the new peaks are computed in the background on the next update
+            self.data_manager.peak_statistics = None
             
-            self.data_manager.update_peak_statistics()
             self.update_callback()
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred during peak detection: {str(e)}")
+
+        self._run_detection(detect_peaks_all_channels, source,
+                            (self.data_manager.sampling_rate, threshold, window_size),
+                            on_detected, "An error occurred during peak detection",
+                            detect_positive=detect_positive)
+
+    def destroy(self):
+        """
+        Destroy the panel, dropping queued processing tasks.
+        """
+        if self._task is not None:
+            self._task.cancel()
+        self._executor.shutdown(wait=False)
+        self._detection_cache.clear()
+        super().destroy()
 
     def get_sampling_rate(self):
         """
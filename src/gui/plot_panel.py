@@ -1,9 +1,126 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.widgets import SpanSelector
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
+from src.analysis.parallel import run_in_blocks
+
+# Simplify dense paths down to pixel resolution and let Agg render them in chunks
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+def _decimate(time, data, num_pixels):
+    """
+    Reduce traces to the minimum and maximum of each pixel-wide bucket of samples.
+
+    Drawing more than a couple of points per pixel does not change the rendered image,
+    so each bucket is replaced by its extreme samples, kept in their original order.
+
+    Args:
+        time (numpy.ndarray): 1D array of time points.
+        data (numpy.ndarray): 2D array of voltage data in channel-major layout (channels x samples).
+        num_pixels (int): Number of horizontal pixels the traces are drawn on.
+
+    Returns:
+        tuple: (time, data), 2D arrays (channels x points) of the decimated traces.
+    """
+    num_channels, num_samples = data.shape
+    bucket_size = num_samples // max(num_pixels, 1)
+    if bucket_size < 2:
+        return np.broadcast_to(time, data.shape), data
+
+    num_buckets = num_samples // bucket_size
+    head = num_buckets * bucket_size
+    starts = np.arange(0, head, bucket_size)[:, np.newaxis]
+    extremes = np.empty((num_channels, num_buckets, 2), dtype=np.intp)
+
+    def find_extremes(start, end):
+        buckets = data[start:end, :head].reshape(end - start, num_buckets, bucket_size)
+        imin = buckets.argmin(axis=2)
+        imax = buckets.argmax(axis=2)
+        np.minimum(imin, imax, out=extremes[start:end, :, 0])
+        np.maximum(imin, imax, out=extremes[start:end, :, 1])
+        extremes[start:end] += starts
+
+    # Channels are independent and NumPy releases the GIL in argmin/argmax, so
+    # blocks of channels are reduced in parallel threads
+    run_in_blocks(find_extremes, num_channels)
+
+    tail = np.broadcast_to(np.arange(head, num_samples), (num_channels, num_samples - head))
+    indices = np.concatenate([extremes.reshape(num_channels, 2 * num_buckets), tail], axis=1)
+    return time[indices], np.take_along_axis(data, indices, axis=1)
+
+def _channel_major(data, columns, block_size=4096):
+    """
+    Gather channels of a samples x channels array into a channel-major single-precision array.
+
+    The transposing copy is done in blocks of samples that fit in the CPU cache; a
+    single fancy-indexed transpose of a long recording is several times slower.
+
+    Args:
+        data (numpy.ndarray): 2D array of voltage data (samples x channels).
+        columns (list): Indices of the channels to gather.
+        block_size (int): Number of samples copied per block.
+
+    Returns:
+        numpy.ndarray: 2D array (channels x samples) of the gathered channels.
+    """
+    gathered = np.empty((len(columns), data.shape[0]), dtype=np.float32)
+    for start in range(0, data.shape[0], block_size):
+        gathered[:, start:start + block_size] = data[start:start + block_size, columns].T
+    return gathered
+
+def _same_sources(sources, cached_sources):
+    """
+    Check whether plotted arrays are the very objects a cached artist was built from.
+
+    Args:
+        sources (tuple): The arrays to be plotted.
+        cached_sources (tuple): The arrays the cached artist was built from, or None.
+
+    Returns:
+        bool: True if every array is identical to its cached counterpart.
+    """
+    return cached_sources is not None and len(sources) == len(cached_sources) and \
+        all(source is cached for source, cached in zip(sources, cached_sources))
+
+def _thin_markers(x, y, xlim, ylim, width, height):
+    """
+    Reduce markers to at most one per pixel of the axes.
+
+    Markers outside the view are dropped, and of all markers falling on the same pixel
+    only one is kept, at its original coordinates. Marker rendering cost then depends
+    on the size of the axes instead of on the number of marked samples, while every
+    drawn marker stays at the position of a real marked sample.
+
+    Args:
+        x (numpy.ndarray): 1D array of marker x-coordinates.
+        y (numpy.ndarray): 1D array of marker y-coordinates.
+        xlim (tuple): View limits (min, max) along x.
+        ylim (tuple): View limits (min, max) along y.
+        width (int): Width of the axes in pixels.
+        height (int): Height of the axes in pixels.
+
+    Returns:
+        tuple: (x, y), 1D arrays of the remaining marker coordinates.
+    """
+    (x0, x1), (y0, y1) = sorted(xlim), sorted(ylim)
+    if width <= 0 or height <= 0 or x0 == x1 or y0 == y1:
+        return x, y
+    inside = np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+    px = ((x[inside] - x0) * (width / (x1 - x0))).astype(np.intp)
+    py = ((y[inside] - y0) * (height / (y1 - y0))).astype(np.intp)
+    # Each pixel of a grid records one of the markers falling on it, which avoids
+    # sorting the markers
+    owner = np.full((width + 1) * (height + 1), -1, dtype=np.intp)
+    owner[px * (height + 1) + py] = inside
+    kept = owner[owner >= 0]
+    return x[kept], y[kept]
 
 class PlotPanel(ttk.Frame):
     """
@@ -43,6 +160,44 @@ class PlotPanel(ttk.Frame):
         self.selected_range = None
         self.span_selector_active = False
 
+        # Artists reused across updates: the trace and average peak window collections
+        # and the artifact and peak markers
+        self._trace_collection = LineCollection([], linewidths=1, rasterized=True)
+        self.ax1.add_collection(self._trace_collection, autolim=False)
+        self._trace_range = None
+        # Source arrays and channels of the plotted traces, and their full-view segments,
+        # reused by updates that do not change the traces (e.g. after peak detection)
+        self._trace_source = None
+        self._trace_columns = None
+        self._full_segments = None
+        self._artifact_source = None
+        self._artifact_columns = None
+        self._artifact_points = {}
+        self._peak_source = None
+        self._peak_columns = None
+        self._avg_source = None
+        self._avg_columns = None
+        self._avg_segments = None
+        # Created with the first average peak windows, as peak detection may never run
+        self._avg_collection = None
+        # The markers are animated: full draws leave them out of the cached background of
+        # the main axes, and updates that only change markers blit them over it
+        self._artifact_line, = self.ax1.plot([], [], 'rx', rasterized=True, animated=True)
+        self._peak_line, = self.ax1.plot([], [], 'go', animated=True)
+        self._background = None
+        # Segment arrays currently set on the trace and average peak window collections
+        self._shown_segments = None
+        self._shown_avg_segments = None
+        self._window_time_cache = {}
+        self._legend_entries = {}
+        self._trace_pixels = None
+        # Coordinates of all artifact markers; the marker line only shows one per pixel
+        self._artifact_xy = None
+        self.ax1.callbacks.connect('xlim_changed', self.on_xlim_changed)
+        self.ax1.callbacks.connect('ylim_changed', self.on_ylim_changed)
+        self.canvas.mpl_connect('resize_event', self.on_resize)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
     def create_plot(self):
         """
         Create the matplotlib figure and canvas.
@@ -50,7 +205,9 @@ class PlotPanel(ttk.Frame):
         Returns:
             tuple: A tuple containing the matplotlib figure and canvas.
         """
-        fig = plt.figure(figsize=(10, 8), dpi=100, facecolor='black')
+        # The figure is created directly rather than through pyplot, so it is not kept
+        # alive by pyplot's global figure manager after the panel is destroyed
+        fig = Figure(figsize=(10, 8), dpi=100, facecolor='black')
         canvas = FigureCanvasTkAgg(fig, master=self)
         
         # Create subplots with fixed positions
@@ -83,56 +240,139 @@ class PlotPanel(ttk.Frame):
         Args:
             data_dict (dict): A dictionary containing the data to be plotted.
         """
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        self.ax1.set_facecolor('black')
-        self.ax2.set_facecolor('black')
-        
-        self.ax1.set_title("Electrophysiology Data", fontsize=14, fontweight='bold', color='white')
-        self.ax1.set_xlabel("Time (s)", fontsize=12, color='white')
-        self.ax1.set_ylabel("Voltage (mV)", fontsize=12, color='white')
-        
-        self.ax2.set_title("Average Peak Window", fontsize=14, fontweight='bold', color='white')
-        self.ax2.set_xlabel("Time (ms)", fontsize=12, color='white')
-        self.ax2.set_ylabel("Voltage (mV)", fontsize=12, color='white')
-        
+        scene = self._static_scene()
+        # The artists persist between updates; only their data is replaced when it
+        # changed, and markers that are not plotted are hidden
+        for line in [self._artifact_line, self._peak_line]:
+            line.set_visible(False)
+        self._trace_collection.set_segments([])
+        self._shown_segments = None
+        if self._avg_collection is not None:
+            self._avg_collection.set_segments([])
+        self._shown_avg_segments = None
+        self._trace_range = None
+
+        for ax in [self.ax1, self.ax2]:
+            ax.relim(visible_only=True)
+            ax.set_autoscale_on(True)
+
+        legend_entries = ((), ())
+        avg_entries = ((), ())
         if data_dict['data'] is not None:
+            # Inputs are used in their own memory layout: the traces are gathered per block
+            # of samples, so a column-major recording (e.g. from an .rhd file) is not copied
+            time = np.asarray(data_dict['time'])
+            data = np.asarray(data_dict['data'])
+            artifacts = data_dict['artifacts']
+            peaks = data_dict['peaks']
+            avg_peak_windows = data_dict['avg_peak_windows']
             selected_channels = data_dict['selected_channels']
-            for i, channel_index in enumerate(selected_channels):
-                self.ax1.plot(data_dict['time'], data_dict['data'][:, i], label=f'Channel {channel_index}')
+            channel_positions = {label: i for i, label in data_dict['channel_mapping'].items()}
+            columns = [channel_positions[label] for label in selected_channels]
+            column_index = np.asarray(columns, dtype=np.intp)
+            colors = [f'C{i % 10}' for i in range(len(columns))]
+
+            # All traces go into a single collection instead of one Line2D per channel,
+            # decimated to the width of the axes and re-decimated whenever the view changes
+            trace_source = (data_dict['data'], data_dict['time'])
+            if self._trace_columns != columns or not _same_sources(trace_source, self._trace_source):
+                self._trace_time = time
+                # The selected traces are kept channel-major so that each channel is contiguous,
+                # and in single precision, which is plenty for pixel-resolution drawing
+                self._trace_data = _channel_major(data, column_index)
+                self._trace_source, self._trace_columns = trace_source, columns
+                self._full_segments = None
+            # Segments of the whole traces are only rebuilt when the traces or the axes width change
+            if self._full_segments is None or self._full_segments[0] != int(self.ax1.bbox.width):
+                self._full_segments = (int(self.ax1.bbox.width), self._trace_segments(0, len(time)))
+            segments = self._full_segments[1]
+            self._trace_range = (0, len(time))
+            self._trace_collection.set_segments(segments)
+            self._shown_segments = segments
+            self._trace_collection.set_colors(colors)
+            legend_entries = (tuple(selected_channels), tuple(colors))
             
-            if data_dict['artifacts'] is not None:
-                for i, channel_index in enumerate(selected_channels):
-                    artifact_mask = data_dict['artifacts'][:, i]
-                    if len(artifact_mask) == len(data_dict['time']):
-                        self.ax1.plot(data_dict['time'][artifact_mask], data_dict['data'][artifact_mask, i], 'rx')
-                    else:
-                        print(f"Warning: Artifact mask for channel {channel_index} doesn't match data dimensions.")
+            # A mask that doesn't match the data is not drawn; FilterPanel warns about it on detection
+            if artifacts is None or len(artifacts) != len(time):
+                self._release_caches(traces=False, peaks=False, averages=False)
+            else:
+                # Artifact coordinates are computed once per channel and mask, the first
+                # time the channel is shown, and the selected channels are drawn by a
+                # single marker line
+                artifact_source = trace_source + (artifacts,)
+                if not _same_sources(artifact_source, self._artifact_source):
+                    self._artifact_points.clear()
+                    self._artifact_source, self._artifact_columns = artifact_source, None
+                if self._artifact_columns != columns:
+                    points = [self._channel_artifacts(time, data, artifacts, column) for column in columns]
+                    self._artifact_xy = tuple(np.concatenate([p[i] for p in points] or [np.empty(0)]) for i in (0, 1))
+                    self._artifact_columns = columns
+                self._artifact_line.set_visible(True)
             
-            if data_dict['peaks'] is not None:
-                for i, channel_index in enumerate(selected_channels):
-                    channel_peaks = data_dict['peaks'][i]
-                    self.ax1.plot(data_dict['time'][channel_peaks], data_dict['data'][channel_peaks, i], 'go')
+            if peaks is None:
+                self._release_caches(traces=False, artifacts=False, averages=False)
+            else:
+                # Peaks of all selected channels are drawn by a single marker line too,
+                # rebuilt only when the peaks, the traces or the selection change
+                peak_source = trace_source + (peaks,)
+                if self._peak_columns != columns or not _same_sources(peak_source, self._peak_source):
+                    selected_peaks = [peaks[column] for column in columns]
+                    peak_rows = np.concatenate(selected_peaks or [np.empty(0, dtype=np.intp)])
+                    peak_columns = np.repeat(column_index, [len(p) for p in selected_peaks])
+                    self._peak_line.set_data(time[peak_rows], data[peak_rows, peak_columns])
+                    self._peak_source, self._peak_columns = peak_source, columns
+                self._peak_line.set_visible(True)
             
-            if data_dict['avg_peak_windows'] is not None:
-                for i, channel_index in enumerate(selected_channels):
-                    avg_window = data_dict['avg_peak_windows'][i]
-                    if avg_window is not None:
-                        window_time = np.linspace(-50, 50, len(avg_window))
-                        self.ax2.plot(window_time, avg_window, label=f'Channel {channel_index}')
+            if avg_peak_windows is None:
+                self._release_caches(traces=False, artifacts=False, peaks=False)
+            else:
+                # The average windows are drawn as one collection as well, rebuilt only
+                # when the averages or the selection change
+                if self._avg_columns != columns or not _same_sources((avg_peak_windows,), self._avg_source):
+                    self._avg_source, self._avg_columns = (avg_peak_windows,), columns
+                    self._avg_segments = None
+                    averaged = [(avg_peak_windows[column], color, label)
+                                for label, column, color in zip(selected_channels, columns, colors)
+                                if avg_peak_windows[column] is not None]
+                    if averaged:
+                        avg_windows, avg_colors, avg_labels = zip(*averaged)
+                        avg_segments = np.empty((len(avg_windows), len(avg_windows[0]), 2))
+                        avg_segments[:, :, 0] = self._window_time(len(avg_windows[0]))
+                        avg_segments[:, :, 1] = avg_windows
+                        avg_extent = [(-50, avg_segments[:, :, 1].min()), (50, avg_segments[:, :, 1].max())]
+                        self._avg_segments = (avg_segments, avg_colors, avg_labels, avg_extent)
+                if self._avg_segments is not None:
+                    avg_segments, avg_colors, avg_labels, avg_extent = self._avg_segments
+                    if self._avg_collection is None:
+                        self._avg_collection = LineCollection([])
+                        self.ax2.add_collection(self._avg_collection, autolim=False)
+                    self._avg_collection.set_segments(avg_segments)
+                    self._shown_avg_segments = avg_segments
+                    self._avg_collection.set_colors(avg_colors)
+                    # The extent is known, so the collection's paths are never scanned for limits
+                    self.ax2.update_datalim(avg_extent)
+                    avg_entries = (avg_labels, avg_colors)
+
+        else:
+            self._release_caches()
+
+        # Collections are not part of relim, so the trace extent is added explicitly
+        if data_dict['data'] is not None and segments.size > 0:
+            self.ax1.update_datalim([(time[0], segments[:, :, 1].min()), (time[-1], segments[:, :, 1].max())])
+        self.ax1.autoscale_view()
+        self.ax2.autoscale_view()
+        self._update_artifact_markers()
         
-        for ax in [self.ax1, self.ax2]:
-            ax.spines['right'].set_visible(False)
-            ax.spines['top'].set_visible(False)
-            ax.spines['bottom'].set_color('white')
-            ax.spines['left'].set_color('white')
-            ax.tick_params(axis='x', colors='white')
-            ax.tick_params(axis='y', colors='white')
-            ax.legend(fontsize=10, facecolor='black', edgecolor='white', labelcolor='white')
+        self._update_legend(self.ax1, *legend_entries)
+        self._update_legend(self.ax2, *avg_entries)
         
-        self.canvas.draw()
-        self.toolbar.update()
+        if self._background is not None and self._same_scene(scene, self._static_scene()):
+            # Only the markers changed (e.g. detection re-run with another threshold),
+            # so they are blitted over the background instead of redrawing the figure
+            self._blit_markers()
+        else:
+            # Let Tk coalesce bursts of updates into a single repaint
+            self.canvas.draw_idle()
 
         # Create or update span selector based on its active state
         if self.span_selector_active:
@@ -140,6 +380,234 @@ class PlotPanel(ttk.Frame):
         else:
             self.remove_span_selector()
 
+    def _release_caches(self, traces=True, artifacts=True, peaks=True, averages=True):
+        """
+        Drop cached source arrays and the data derived from them, so that data which is no
+        longer plotted (e.g. after clearing or loading another file) can be freed.
+
+        Args:
+            traces (bool): Release the traces.
+            artifacts (bool): Release the artifact markers.
+            peaks (bool): Release the peak markers.
+            averages (bool): Release the average peak windows.
+        """
+        if traces:
+            self._trace_time = self._trace_data = None
+            self._trace_source = self._trace_columns = self._full_segments = None
+        if artifacts:
+            self._artifact_source = self._artifact_columns = self._artifact_xy = None
+            self._artifact_points.clear()
+            self._artifact_line.set_data([], [])
+        if peaks:
+            self._peak_source = self._peak_columns = None
+            self._peak_line.set_data([], [])
+        if averages:
+            self._avg_source = self._avg_columns = self._avg_segments = None
+
+    def _static_scene(self):
+        """
+        Describe everything drawn besides the markers.
+
+        Returns:
+            tuple: The shown trace and average segment arrays, the legend entries,
+                the view limits of both axes and the figure size.
+        """
+        return (self._shown_segments, self._shown_avg_segments,
+                self._legend_entries.get(self.ax1), self._legend_entries.get(self.ax2),
+                tuple(self.ax1.viewLim.bounds), tuple(self.ax2.viewLim.bounds), tuple(self.fig.bbox.bounds))
+
+    def _same_scene(self, scene, other):
+        """
+        Check whether two results of _static_scene describe the same drawing.
+
+        Args:
+            scene (tuple): A result of _static_scene.
+            other (tuple): Another result of _static_scene.
+
+        Returns:
+            bool: True if the segment arrays are identical and everything else is equal.
+        """
+        return scene[0] is other[0] and scene[1] is other[1] and scene[2:] == other[2:]
+
+    def on_draw(self, event):
+        """
+        Callback for full draws of the canvas; caches the background of the main axes
+        and draws the animated markers over it.
+
+        Args:
+            event: The matplotlib draw event.
+        """
+        if self.fig.canvas.is_saving():
+            return  # Animated artists are drawn normally when the figure is saved
+        self._background = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """
+        Draw the animated artists of the main axes (the markers and the span selector)
+        onto the canvas, in z-order.
+        """
+        animated = [artist for artist in self.ax1.get_children() if artist.get_animated()]
+        for artist in sorted(animated, key=lambda artist: artist.get_zorder()):
+            self.ax1.draw_artist(artist)
+
+    def _blit_markers(self):
+        """
+        Redraw the markers over the cached background of the main axes and blit only that region.
+        """
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.ax1.bbox)
+
+    def _channel_artifacts(self, time, data, artifacts, column):
+        """
+        Get the coordinates of the artifact samples of a channel, computed once per mask.
+
+        Args:
+            time (numpy.ndarray): 1D array of time points.
+            data (numpy.ndarray): 2D array of voltage data (samples x channels).
+            artifacts (numpy.ndarray): 2D boolean artifact mask (samples x channels).
+            column (int): Index of the channel.
+
+        Returns:
+            tuple: (x, y), 1D arrays of the artifact marker coordinates.
+        """
+        points = self._artifact_points.get(column)
+        if points is None:
+            rows = np.flatnonzero(artifacts[:, column])
+            points = self._artifact_points[column] = (time[rows], data[rows, column])
+        return points
+
+    def _update_legend(self, ax, labels, colors):
+        """
+        Rebuild the legend of an axes, unless its entries are unchanged since the last update.
+
+        The legend is removed when there are no entries.
+
+        Args:
+            ax: The axes of the legend.
+            labels (tuple): Channel labels of the entries.
+            colors (tuple): Line colors of the entries.
+        """
+        if self._legend_entries.get(ax) == (labels, colors):
+            return
+        self._legend_entries[ax] = (labels, colors)
+        if not labels:
+            # An axes without entries gets no legend at all rather than an empty one
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            return
+        handles = [Line2D([], [], color=color, label=label) for color, label in zip(colors, labels)]
+        # A fixed location avoids the data-dependent search of loc='best' on every draw
+        ax.legend(handles=handles, loc='upper right', fontsize=10, labelcolor='white', frameon=False, handlelength=1)
+
+    def _window_time(self, window_size):
+        """
+        Get the time axis (in ms) of peak windows of a given size, computed once per size.
+
+        Args:
+            window_size (int): Number of samples in a peak window.
+
+        Returns:
+            numpy.ndarray: Time points from -50 to 50 ms.
+        """
+        window_time = self._window_time_cache.get(window_size)
+        if window_time is None:
+            window_time = self._window_time_cache[window_size] = np.linspace(-50, 50, window_size)
+        return window_time
+
+    def _trace_segments(self, start, end):
+        """
+        Build the decimated line segments of the plotted traces between two samples.
+
+        Args:
+            start (int): Index of the first sample.
+            end (int): Index past the last sample.
+
+        Returns:
+            numpy.ndarray: Segment array (channels x points x 2).
+        """
+        self._trace_pixels = int(self.ax1.bbox.width)
+        time, values = _decimate(self._trace_time[start:end], self._trace_data[:, start:end], self._trace_pixels)
+        segments = np.empty(values.shape + (2,))
+        segments[:, :, 0] = time
+        segments[:, :, 1] = values
+        self._trace_range = (start, end)
+        return segments
+
+    def on_xlim_changed(self, ax):
+        """
+        Callback for changes of the main plot's x-limits; re-decimates the visible traces
+        and artifact markers.
+
+        Args:
+            ax: The axes whose limits changed.
+        """
+        self._update_artifact_markers()
+        if self._trace_range is None:
+            return
+        xmin, xmax = ax.get_xlim()
+        start = max(np.searchsorted(self._trace_time, xmin) - 1, 0)
+        end = min(np.searchsorted(self._trace_time, xmax, side='right') + 1, len(self._trace_time))
+        if (start, end) != self._trace_range and start < end:
+            self._shown_segments = self._trace_segments(start, end)
+            self._trace_collection.set_segments(self._shown_segments)
+
+    def on_ylim_changed(self, ax):
+        """
+        Callback for changes of the main plot's y-limits; re-decimates the visible artifact markers.
+
+        Args:
+            ax: The axes whose limits changed.
+        """
+        self._update_artifact_markers()
+
+    def _update_artifact_markers(self):
+        """
+        Show the artifact markers inside the current view, thinned to one per pixel.
+        """
+        if self._artifact_xy is None or not self._artifact_line.get_visible():
+            return
+        bbox = self.ax1.bbox
+        self._artifact_line.set_data(*_thin_markers(*self._artifact_xy, self.ax1.get_xlim(), self.ax1.get_ylim(),
+                                                    int(bbox.width), int(bbox.height)))
+
+    def on_resize(self, event):
+        """
+        Callback for resizes of the canvas; re-decimates the traces to the new width of the axes.
+
+        The Tk canvas already resizes the figure to the widget, so rendering happens at the
+        displayed size; only the decimation of traces and markers, which depends on the size
+        of the axes in pixels, needs updating.
+
+        Args:
+            event: The matplotlib resize event.
+        """
+        if self._trace_range is not None and int(self.ax1.bbox.width) != self._trace_pixels:
+            self._shown_segments = self._trace_segments(*self._trace_range)
+            self._trace_collection.set_segments(self._shown_segments)
+        self._update_artifact_markers()
+
+    def on_new_dataset(self):
+        """
+        Reset the toolbar's navigation history after a new data file has been loaded,
+        so that its home view refers to the new data.
+        """
+        self.toolbar.update()
+
+    def destroy(self):
+        """
+        Destroy the panel and release the plotted data and matplotlib artists.
+        """
+        self._trace_range = None
+        self._release_caches()
+        self._window_time_cache.clear()
+        self._legend_entries.clear()
+        self._background = self._shown_segments = self._shown_avg_segments = None
+        self.span_selector = None
+        self.fig.clear()
+        super().destroy()
+
     def create_span_selector(self):
         """
         Create a span selector on the main plot for data trimming.
@@ -155,9 +623,19 @@ class PlotPanel(ttk.Frame):
     def remove_span_selector(self):
         """
         Remove the span selector from the main plot.
+
+        The selector is dropped rather than hidden: while it is connected, it renders
+        the figure a second time on every draw to keep the animated markers out of its
+        blitting background.
         """
         if self.span_selector is not None:
+            # Its artists are hidden and blitted away before they are removed
             self.span_selector.set_visible(False)
+            self.span_selector.update()
+            self.span_selector.disconnect_events()
+            for artist in self.span_selector.artists:
+                artist.remove()
+            self.span_selector = None
         self.selected_range = None
 
     def on_select(self, xmin, xmax):
@@ -176,8 +654,10 @@ class PlotPanel(ttk.Frame):
         Toggle the visibility of the span selector.
         """
         self.span_selector_active = not self.span_selector_active
+        # Only the selector's own artists change, so they are blitted over the cached
+        # background of the main axes instead of redrawing the whole figure
         if self.span_selector_active:
             self.create_span_selector()
+            self.span_selector.update()
         else:
-            self.remove_span_selector()
-        self.canvas.draw()
\ No newline at end of file
+            self.remove_span_selector()
\ No newline at end of file
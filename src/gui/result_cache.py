@@ -0,0 +1,66 @@
+import weakref
+from collections import OrderedDict
+
+class DataResultCache:
+    """
+    A small least-recently-used cache of results computed from a data array.
+
+    Entries are keyed by the identity of the array and further parameters, and keep
+    only a weak reference to the array. The id of a freed array may be reused by a new
+    one, so an entry only matches while its array is alive; entries whose array has
+    been freed are dropped on every lookup and insert, so that they never keep large
+    results alive.
+    """
+
+    def __init__(self, max_entries=4):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Number of results kept; the least recently used is evicted first.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, data, key):
+        """
+        Look up a result computed from an array.
+
+        Args:
+            data (numpy.ndarray): The array the result was computed from.
+            key (hashable): The parameters of the computation.
+
+        Returns:
+            The cached result, or None if there is none.
+        """
+        self._drop_dead()
+        full_key = (id(data), key)
+        entry = self._entries.get(full_key)
+        if entry is None or entry[0]() is not data:
+            return None
+        self._entries.move_to_end(full_key)
+        return entry[1]
+
+    def put(self, data, key, result):
+        """
+        Store a result computed from an array.
+
+        Args:
+            data (numpy.ndarray): The array the result was computed from.
+            key (hashable): The parameters of the computation.
+            result: The result to be stored.
+        """
+        self._drop_dead()
+        self._entries[(id(data), key)] = (weakref.ref(data), result)
+        self._entries.move_to_end((id(data), key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+    def _drop_dead(self):
+        """Remove the entries whose array has been freed."""
+        for full_key in [k for k, (ref, _) in self._entries.items() if ref() is None]:
+            del self._entries[full_key]
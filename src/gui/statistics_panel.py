@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
+import numpy as np
 
 class StatisticsPanel(ttk.Frame):
     """
@@ -17,6 +19,12 @@ class StatisticsPanel(ttk.Frame):
         """
         super().__init__(parent, style="Dark.TFrame", width=350)  # Set width to 350 pixels
         self.pack_propagate(False)  # Prevent the frame from shrinking to fit its contents
+        self._pending = None  # Identifier of the scheduled idle refresh, if any
+        self._pending_args = None
+        # Statistics requested with request_update are computed in this worker thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._latest_request = None
+        self._shown_rows = {}  # Rows currently displayed in each Treeview
         self.create_widgets()
 
     def create_widgets(self):
@@ -81,53 +89,238 @@ class StatisticsPanel(ttk.Frame):
         frame.grid_rowconfigure(0, weight=1)
         frame.grid_columnconfigure(0, weight=1)
 
-        # Configure column headings and widths
+        # Configure column headings and fixed widths, so that Tk never resizes columns to their contents
         for col in columns:
             tree.heading(col, text=col)
-            tree.column(col, anchor="center", width=120)  # Set column width to 120 pixels
+            tree.column(col, anchor="center", width=120, minwidth=120, stretch=False)  # Set column width to 120 pixels
 
         return tree
 
     def update_statistics(self, channel_statistics=None, peak_statistics=None, channel_mapping=None):
+        """
+        Schedule an update of the statistics displayed in the Treeviews.
+
+        The Treeviews are refilled once Tk is idle, so several updates requested in quick
+        succession are coalesced into a single refresh showing the latest statistics.
+
+        Args:
+            channel_statistics (numpy.ndarray): A structured array of channel statistics.
+            peak_statistics (list or dict): A list of dictionaries containing peak statistics,
+                or a dictionary of equally long arrays, one per statistic.
+            channel_mapping (dict): A dictionary mapping channel indices to their original numbers.
+        """
+        # Statistics given directly are newer than any still being computed
+        self._drop_request()
+        self._schedule_update(channel_statistics, peak_statistics, channel_mapping)
+
+    def _schedule_update(self, *args):
+        """Schedule a refresh of the Treeviews with the given statistics when Tk is idle."""
+        self._pending_args = args
+        if self._pending is None:
+            self._pending = self.after_idle(self._flush_pending)
+
+    def request_update(self, compute_fn, *args, on_result=None):
+        """
+        Compute statistics in a worker thread and display them once they are ready.
+
+        Only the Treeviews are updated in the Tk thread, so the GUI stays responsive
+        while the statistics are computed. Results of a request that has been superseded
+        by a newer request or update are discarded.
+
+        Args:
+            compute_fn (function): Function computing the statistics. It must not read
+                state that the Tk thread may change meanwhile; its inputs are passed as args.
+            *args: Arguments passed to compute_fn.
+            on_result (function): Called in the Tk thread with the result of compute_fn;
+                returns the tuple (channel_statistics, peak_statistics, channel_mapping)
+                to be displayed, or None to discard the result. If not given, compute_fn
+                must return that tuple itself.
+        """
+        self._drop_request()
+        future = self._executor.submit(compute_fn, *args)
+        self._latest_request = future
+
+        def hand_over(done):
+            # The worker never touches the widgets; the result is handed over to the Tk thread
+            if not done.cancelled():
+                self.after(0, self._show_result, done, on_result)
+
+        future.add_done_callback(hand_over)
+
+    def _drop_request(self):
+        """Forget the latest statistics request, removing it from the queue if it has not started yet."""
+        if self._latest_request is not None:
+            self._latest_request.cancel()
+            self._latest_request = None
+
+    def _show_result(self, future, on_result=None):
+        """
+        Display the result of a statistics computation started by request_update.
+
+        Args:
+            future (concurrent.futures.Future): The finished computation.
+            on_result (function): The result handler given to request_update, if any.
+        """
+        if future is not self._latest_request:
+            return
+        self._latest_request = None
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to compute statistics: {str(e)}")
+            return
+        if on_result is not None:
+            result = on_result(result)
+            if result is None:
+                return
+        self._schedule_update(*result)
+
+    def _flush_pending(self):
+        """Apply the most recently requested statistics update."""
+        self._pending = None
+        args, self._pending_args = self._pending_args, None
+        self._do_update_statistics(*args)
+
+    def _do_update_statistics(self, channel_statistics=None, peak_statistics=None, channel_mapping=None):
         """
         Update the statistics displayed in the Treeviews.
 
+        Treeviews whose formatted rows are unchanged are left untouched. Updated
+        Treeviews are redrawn once at the end with update_idletasks. This module
+        never calls update(), which would also process pending events and re-enter
+        the GUI in the middle of a refresh.
+
         Args:
-            channel_statistics (list): A list of dictionaries containing channel statistics.
-            peak_statistics (list): A list of dictionaries containing peak statistics.
+            channel_statistics (numpy.ndarray): A structured array of channel statistics.
+            peak_statistics (list or dict): A list of dictionaries containing peak statistics,
+                or a dictionary of equally long arrays, one per statistic.
             channel_mapping (dict): A dictionary mapping channel indices to their original numbers.
         """
-        if channel_statistics and channel_mapping:
-            # Clear existing items in the channel statistics Treeview
-            self.channel_tree.delete(*self.channel_tree.get_children())
-            # Insert new channel statistics
-            for stats in channel_statistics:
-                original_channel = channel_mapping[stats['channel']]
-                self.channel_tree.insert("", "end", values=(
-                    original_channel,
-                    f"{stats['mean']:.2f}",
-                    f"{stats['std']:.2f}"
-                ))
+        # Channel indices are dense (0..N-1), so labels are looked up by list indexing
+        labels = [channel_mapping[i] for i in range(len(channel_mapping))] if channel_mapping else []
+        updated = False
+
+        if channel_statistics is not None and len(channel_statistics) > 0 and channel_mapping:
+            rows = [(labels[stats['channel']], format(stats['mean'], '.2f'), format(stats['std'], '.2f'))
+                    for stats in channel_statistics]
+            updated |= self._fill_tree(self.channel_tree, rows)
 
         if peak_statistics and channel_mapping:
-            # Clear existing items in the peak statistics Treeview
-            self.peak_tree.delete(*self.peak_tree.get_children())
-            # Insert new peak statistics
-            for stats in peak_statistics:
-                original_channel = channel_mapping[stats['channel']]
-                self.peak_tree.insert("", "end", values=(
-                    original_channel,
-                    stats['num_peaks'],
-                    f"{stats['frequency']:.2f}",
-                    f"{stats['avg_amplitude']:.2f}",
-                    f"{stats['std_amplitude']:.2f}",
-                    f"{stats['mean_inter_peak_distance']:.2f}",
-                    f"{stats['std_inter_peak_distance']:.2f}",
-                    f"{stats['mean_inter_peak_time']*1000:.2f}",  # Convert to ms
-                    f"{stats['std_inter_peak_time']*1000:.2f}"    # Convert to ms
-                ))
+            updated |= self._fill_tree(self.peak_tree, self._peak_rows(peak_statistics, labels))
+
+        if updated:
+            self.update_idletasks()
+
+    def _peak_rows(self, peak_statistics, labels):
+        """
+        Format peak statistics into rows of the peak statistics Treeview.
+
+        Args:
+            peak_statistics (list or dict): A list of dictionaries containing peak statistics,
+                or a dictionary of equally long arrays, one per statistic.
+            labels (list): Channel labels, indexed by channel.
+
+        Returns:
+            list: Tuples of formatted values, one per channel.
+        """
+        fields = ['frequency', 'avg_amplitude', 'std_amplitude',
+                  'mean_inter_peak_distance', 'std_inter_peak_distance']
+        if isinstance(peak_statistics, dict):
+            # Whole columns are formatted at once and then zipped into rows
+            columns = [
+                [labels[channel] for channel in np.asarray(peak_statistics['channel']).tolist()],
+                np.asarray(peak_statistics['num_peaks']).tolist(),
+                *(np.char.mod('%.2f', np.asarray(peak_statistics[field], dtype=float)).tolist() for field in fields),
+                np.char.mod('%.2f', np.asarray(peak_statistics['mean_inter_peak_time'], dtype=float) * 1000).tolist(),  # Convert to ms
+                np.char.mod('%.2f', np.asarray(peak_statistics['std_inter_peak_time'], dtype=float) * 1000).tolist(),   # Convert to ms
+            ]
+            return list(zip(*columns))
+
+        return [(labels[stats['channel']],
+                 stats['num_peaks'],
+                 *(format(stats[field], '.2f') for field in fields),
+                 format(stats['mean_inter_peak_time'] * 1000, '.2f'),  # Convert to ms
+                 format(stats['std_inter_peak_time'] * 1000, '.2f'))   # Convert to ms
+                for stats in peak_statistics]
+
+    def _fill_tree(self, tree, rows):
+        """
+        Replace the rows of a Treeview, unless it already displays exactly these rows.
+
+        When the number of rows is unchanged, only the rows whose values differ are
+        overwritten in place; otherwise all items are deleted and reinserted.
+
+        Args:
+            tree (ttk.Treeview): The Treeview to be filled.
+            rows (list): Tuples of formatted values, one per row.
+
+        Returns:
+            bool: True if the Treeview was changed.
+        """
+        shown_rows = self._shown_rows.get(tree)
+        if shown_rows == rows:
+            return False
+        if shown_rows is not None and len(shown_rows) == len(rows):
+            item = tree.item
+            for item_id, shown_row, row in zip(tree.get_children(), shown_rows, rows):
+                if shown_row != row:
+                    item(item_id, values=row)
+            self._shown_rows[tree] = rows
+            return True
+        yscrollcommand = self._begin_bulk_update(tree)
+        # Clear existing items, then insert the new rows through a local binding
+        tree.delete(*tree.get_children())
+        insert = tree.insert
+        for row in rows:
+            insert("", "end", values=row)
+        self._end_bulk_update(tree, yscrollcommand)
+        self._shown_rows[tree] = rows
+        return True
+
+    def _begin_bulk_update(self, tree):
+        """
+        Prepare a Treeview for replacing its rows.
+
+        The Treeview is removed from the grid and disconnected from its vertical scrollbar,
+        so that Tk does not lay out, redraw and rescroll it after every inserted row.
+
+        Args:
+            tree (ttk.Treeview): The Treeview to be updated.
+
+        Returns:
+            str: The Treeview's scroll command, to be restored by _end_bulk_update.
+        """
+        yscrollcommand = tree.cget("yscrollcommand")
+        tree.grid_remove()
+        tree.configure(yscrollcommand="")
+        return yscrollcommand
+
+    def _end_bulk_update(self, tree, yscrollcommand):
+        """
+        Reconnect a Treeview to its scrollbar and show it again after a bulk update.
+
+        Args:
+            tree (ttk.Treeview): The updated Treeview.
+            yscrollcommand (str): The scroll command returned by _begin_bulk_update.
+        """
+        tree.configure(yscrollcommand=yscrollcommand)
+        tree.grid()
+
+    def destroy(self):
+        """
+        Destroy the panel, dropping queued statistics computations.
+        """
+        self._drop_request()
+        self._executor.shutdown(wait=False)
+        super().destroy()
 
     def clear_statistics(self):
         """Clear all statistics from the Treeviews."""
+        self._drop_request()
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+            self._pending_args = None
+        self._shown_rows.clear()
         self.channel_tree.delete(*self.channel_tree.get_children())
         self.peak_tree.delete(*self.peak_tree.get_children())
\ No newline at end of file